@@ -4,6 +4,7 @@ import os
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.messages import SystemMessage
 from langchain.agents import AgentExecutor, create_openai_tools_agent
 from tools import web_scraper_tool, query_generator_tool
 
@@ -63,10 +64,9 @@ for tool in tools:
 # 4) 프롬프트 템플릿 정의
 # ─────────────────────────────────────────────
 
-# **중요**: OpenAI Tools Agent에 맞는 프롬프트 구조 사용
-# 기존 ReAct 방식과 다른 구조를 사용해야 함
-prompt = ChatPromptTemplate.from_messages([
-    ("system", """
+# 시스템 프롬프트는 변수가 없는 고정 문자열이므로 템플릿 대신 SystemMessage 상수로 한 번만 생성
+# (매 호출 동일한 접두부가 전송되어 OpenAI 자동 프롬프트 캐싱에도 유리)
+SYSTEM_PROMPT = """
     당신은 전문적인 AI 리서치 에이전트입니다. 사용자가 요청한 주제에 대해 철저한 조사를 수행하고 전문적인 보고서를 작성합니다.
 
     ## 🎯 당신의 역할:
@@ -118,8 +118,16 @@ prompt = ChatPromptTemplate.from_messages([
     - 출처가 불분명한 내용은 반드시 언급
     - 객관적이고 균형 잡힌 시각 유지
     - 전문 용어 사용 시 간단한 설명 추가
-    """),
+    """
+
+SYSTEM_MSG = SystemMessage(content=SYSTEM_PROMPT)
+
+# **중요**: OpenAI Tools Agent에 맞는 프롬프트 구조 사용
+# 기존 ReAct 방식과 다른 구조를 사용해야 함
+prompt = ChatPromptTemplate.from_messages([
+    SYSTEM_MSG,
     
+    # 동적인 {topic}/{domain} 부분만 템플릿으로 처리
     ("user", """
     🔍 리서치 요청 내용:
     - 주제: {topic}
@@ -152,9 +160,9 @@ agent_executor = AgentExecutor(
     tools=tools,
     verbose=True,                    # 디버깅을 위한 상세 로그
     handle_parsing_errors=True,      # 파싱 오류 자동 처리
-    max_iterations=10,               # 최대 반복 횟수 제한
-    max_execution_time=300,          # 최대 실행 시간 (5분)
-    early_stopping_method="generate", # 조기 종료 방법
+    max_iterations=6,                # 최대 반복 횟수 제한 (단일 보고서 작업에 충분)
+    max_execution_time=120,          # 최대 실행 시간 (2분, 멈춘 도구를 빨리 중단)
+    early_stopping_method="force",   # 조기 종료 시 추가 LLM 호출 없이 즉시 종료
     return_intermediate_steps=False   # 중간 단계 반환 안 함 (성능 개선)
 )
 
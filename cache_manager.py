@@ -1,17 +1,30 @@
 # cache_manager.py — AI 리서치 에이전트 캐시 관리자 (개선 버전)
 
+import asyncio
+import atexit
 import hashlib
 import json
 import os
 import sqlite3
 import threading
+import time
 import pickle
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from contextlib import contextmanager
 
+# 선택적 압축 라이브러리 (설치 시 보고서 본문을 zstd로 압축 저장)
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+# 캐시 파일 확장자별 저장 형식: .zst(zstd 압축 UTF-8), .txt(UTF-8), .pkl(pickle, 이전 버전 호환)
+CACHE_FILE_SUFFIXES = (".zst", ".txt", ".pkl")
+
 # ─────────────────────────────────────────────
 # 1) 캐시 엔트리 데이터 클래스
 # ─────────────────────────────────────────────
@@ -34,13 +47,20 @@ class CacheEntry:
 class CacheManager:
     """AI 리서치 에이전트를 위한 캐시 관리자"""
     
-    def __init__(self, cache_dir: str = "cache", max_size_mb: int = 100):
+    def __init__(self, cache_dir: str = "cache", max_size_mb: int = 100,
+                 mem_cache_size: int = 256, cleanup_interval_sec: float = 3600,
+                 durability: str = "normal"):
         """
         캐시 매니저 초기화
         
         Args:
             cache_dir: 캐시 파일 저장 디렉토리
             max_size_mb: 최대 캐시 크기 (MB)
+            mem_cache_size: 메모리 LRU 캐시에 유지할 최대 항목 수
+            cleanup_interval_sec: 만료 항목 주기적 정리 간격 (초)
+            durability: "normal"(synchronous=NORMAL) 또는 "fast"(synchronous=OFF).
+                "fast"는 커밋 시 fsync를 생략하므로 OS 크래시/정전 시 최근 저장 항목이
+                유실될 수 있음 (캐시는 재생성 가능하므로 허용 가능한 손실)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
@@ -48,10 +68,30 @@ class CacheManager:
         self.db_path = self.cache_dir / "cache.db"
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.lock = threading.RLock()
+        self.durability = durability
+        
+        # 메모리 LRU 캐시 (key -> (value, expires_at)): 반복 조회 시 SQLite/디스크 접근 생략
+        self._mem: OrderedDict = OrderedDict()
+        self._mem_cap = mem_cache_size
         
-        # 초기화 작업
+        # 접근 통계 버퍼 (key -> (증가량, 마지막 접근 시각)): 조회마다 커밋하지 않고 일괄 반영
+        self._pending_access: Dict[str, tuple] = {}
+        self._pending_access_threshold = 32
+        self._access_flush_interval = 30.0
+        self._last_access_flush = time.monotonic()
+        
+        # 영구 SQLite 연결 (작업마다 connect/close 하지 않음, self.lock으로 보호)
+        self._conn = self._open_connection()
+        
+        # 초기화 작업 (만료 항목 정리는 시작을 지연시키지 않도록 백그라운드에서 수행)
         self._init_database()
-        self._cleanup_expired()
+        self._cleanup_interval = cleanup_interval_sec
+        self._cleanup_timer: Optional[threading.Timer] = None
+        threading.Thread(target=self._cleanup_expired, daemon=True, name="cache-cleanup").start()
+        self._schedule_cleanup()
+        
+        # 종료 시 남은 접근 통계 반영 후 연결 종료
+        atexit.register(self.close)
         
         print(f"📦 캐시 매니저 초기화 완료 - 디렉토리: {self.cache_dir}, 최대 크기: {max_size_mb}MB")
     
@@ -69,31 +109,121 @@ class CacheManager:
                     file_path TEXT
                 )
             """)
+            # 만료 정리(expires_at 범위) 및 LRU 정리(last_accessed 정렬)용 인덱스
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache_entries(expires_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_lru ON cache_entries(last_accessed)")
             conn.commit()
     
+    def _open_connection(self) -> sqlite3.Connection:
+        """WAL 모드와 튜닝된 pragma로 영구 연결 생성"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={'OFF' if self.durability == 'fast' else 'NORMAL'}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-20000")
+        return conn
+    
     @contextmanager
     def _get_db_connection(self):
-        """데이터베이스 연결 관리"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """데이터베이스 연결 관리 (영구 연결을 잠금 하에 공유)"""
+        with self.lock:
+            if self._conn is None:
+                raise RuntimeError("CacheManager is closed")
+            try:
+                yield self._conn
+            except Exception:
+                # 커밋되지 않은 트랜잭션이 공유 연결에 남지 않도록 롤백
+                self._conn.rollback()
+                raise
     
-    def _generate_cache_key(self, topic: str, domain: str, query_params: Dict = None) -> str:
-        """캐시 키 생성"""
-        cache_data = {
-            "topic": topic.lower().strip(),
-            "domain": domain.lower().strip(),
-            "params": query_params or {}
-        }
-        cache_string = json.dumps(cache_data, sort_keys=True, ensure_ascii=False)
-        return hashlib.md5(cache_string.encode('utf-8')).hexdigest()
+    def close(self):
+        """남은 접근 통계를 반영하고 데이터베이스 연결 종료"""
+        with self.lock:
+            if self._cleanup_timer is not None:
+                self._cleanup_timer.cancel()
+                self._cleanup_timer = None
+            if self._conn is None:
+                return
+            self._flush_access_stats()
+            self._conn.close()
+            self._conn = None
     
-    def _get_file_path(self, key: str) -> Path:
+    def _generate_cache_key(self, topic: str, domain: str, query_params: Dict = None,
+                            legacy: bool = False) -> str:
+        """
+        캐시 키 생성
+        
+        Args:
+            topic: 검색 주제
+            domain: 검색 도메인
+            query_params: 추가 쿼리 파라미터
+            legacy: True면 기존 디스크 항목 조회용 MD5(JSON) 키 생성
+        """
+        if legacy:
+            cache_data = {
+                "topic": topic.lower().strip(),
+                "domain": domain.lower().strip(),
+                "params": query_params or {}
+            }
+            cache_string = json.dumps(cache_data, sort_keys=True, ensure_ascii=False)
+            return hashlib.md5(cache_string.encode('utf-8')).hexdigest()
+        
+        # JSON 직렬화 없이 길이 접두 UTF-8 바이트를 BLAKE2b에 바로 입력
+        h = hashlib.blake2b(digest_size=16)
+        for part in (topic.lower().strip(), domain.lower().strip(),
+                     repr(sorted((query_params or {}).items()))):
+            data = part.encode('utf-8')
+            h.update(len(data).to_bytes(4, 'little'))
+            h.update(data)
+        return h.hexdigest()
+    
+    def _get_file_path(self, key: str, suffix: str = ".pkl") -> Path:
         """캐시 파일 경로 생성"""
-        return self.cache_dir / f"{key}.pkl"
+        return self.cache_dir / f"{key}{suffix}"
+    
+    def _serialize(self, value: Any) -> Tuple[bytes, str]:
+        """값을 저장용 바이트와 파일 확장자로 변환 (문자열은 pickle 없이 UTF-8로 저장)"""
+        if isinstance(value, str):
+            data = value.encode('utf-8')
+            if zstd is not None:
+                return zstd.ZstdCompressor(level=3).compress(data), ".zst"
+            return data, ".txt"
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ".pkl"
+    
+    def _deserialize(self, file_path: Path, data: bytes) -> Any:
+        """파일 확장자에 맞춰 저장된 바이트를 값으로 복원"""
+        if file_path.suffix == ".zst":
+            if zstd is None:
+                raise RuntimeError("zstd 압축 캐시를 읽으려면 'zstandard' 패키지를 설치해주세요")
+            return zstd.ZstdDecompressor().decompress(data).decode('utf-8')
+        if file_path.suffix == ".txt":
+            return data.decode('utf-8')
+        return pickle.loads(data)
+    
+    def _mem_put(self, key: str, value: Any, expires_at: Optional[datetime]):
+        """메모리 LRU 캐시에 항목 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+        with self.lock:
+            self._mem[key] = (value, expires_at)
+            self._mem.move_to_end(key)
+            while len(self._mem) > self._mem_cap:
+                self._mem.popitem(last=False)
+    
+    def _mem_get(self, key: str) -> Optional[Any]:
+        """메모리 LRU 캐시 조회 (만료된 항목은 제거 후 None 반환)"""
+        with self.lock:
+            entry = self._mem.get(key)
+            if entry is None:
+                return None
+            
+            value, expires_at = entry
+            if expires_at and datetime.now() > expires_at:
+                del self._mem[key]
+                return None
+            
+            self._mem.move_to_end(key)
+            return value
     
     def get(self, topic: str, domain: str, query_params: Dict = None) -> Optional[str]:
         """
@@ -110,16 +240,33 @@ class CacheManager:
         key = self._generate_cache_key(topic, domain, query_params)
         
         with self.lock:
+            # 메모리 캐시 우선 조회
+            data = self._mem_get(key)
+            if data is not None:
+                self._update_access_stats(key)
+                print(f"⚡ 메모리 캐시 히트: {key[:8]}... (주제: {topic})")
+                return data
+            
             try:
                 with self._get_db_connection() as conn:
                     row = conn.execute(
                         "SELECT * FROM cache_entries WHERE key = ?", (key,)
                     ).fetchone()
+                    
+                    # 이전 버전(MD5 키)으로 저장된 항목 호환 조회
+                    if not row:
+                        legacy_key = self._generate_cache_key(topic, domain, query_params, legacy=True)
+                        row = conn.execute(
+                            "SELECT * FROM cache_entries WHERE key = ?", (legacy_key,)
+                        ).fetchone()
+                        if row:
+                            key = legacy_key
                 
                 if not row:
                     return None
                 
                 # 만료 확인
+                expires_at = None
                 if row['expires_at']:
                     expires_at = datetime.fromisoformat(row['expires_at'])
                     if datetime.now() > expires_at:
@@ -135,7 +282,9 @@ class CacheManager:
                     return None
                 
                 with open(file_path, 'rb') as f:
-                    data = pickle.load(f)
+                    data = self._deserialize(file_path, f.read())
+                
+                self._mem_put(key, data, expires_at)
                 
                 # 접근 통계 업데이트
                 self._update_access_stats(key)
@@ -164,15 +313,27 @@ class CacheManager:
         """
         key = self._generate_cache_key(topic, domain, query_params)
         
+        # 직렬화(CPU 작업)는 잠금 밖에서 수행해 여러 스레드가 병렬로 처리하도록 함
+        try:
+            payload, suffix = self._serialize(value)
+        except Exception as e:
+            print(f"❌ 캐시 직렬화 오류: {e}")
+            return False
+        
+        file_path = self._get_file_path(key, suffix)
+        
         with self.lock:
             try:
                 # 파일에 데이터 저장
-                file_path = self._get_file_path(key)
-                with open(file_path, 'wb') as f:
-                    pickle.dump(value, f)
+                file_path.write_bytes(payload)
+                
+                # 다른 형식으로 저장됐던 이전 파일 정리
+                for other_suffix in CACHE_FILE_SUFFIXES:
+                    if other_suffix != suffix:
+                        self._get_file_path(key, other_suffix).unlink(missing_ok=True)
                 
-                # 파일 크기 확인
-                size_bytes = file_path.stat().st_size
+                # 파일 크기 (기록한 바이트 수를 그대로 사용해 stat 호출 생략)
+                size_bytes = len(payload)
                 
                 # 데이터베이스에 메타데이터 저장
                 now = datetime.now()
@@ -187,6 +348,8 @@ class CacheManager:
                           now.isoformat(), size_bytes, str(file_path)))
                     conn.commit()
                 
+                self._mem_put(key, value, expires_at)
+                
                 print(f"💾 캐시 저장: {key[:8]}... (주제: {topic}, 크기: {size_bytes} bytes)")
                 
                 # 캐시 크기 관리
@@ -198,21 +361,51 @@ class CacheManager:
                 print(f"❌ 캐시 저장 오류: {e}")
                 return False
     
+    async def aget(self, topic: str, domain: str, query_params: Dict = None) -> Optional[str]:
+        """비동기 캐시 조회 (파일/DB I/O를 스레드에서 수행하여 이벤트 루프 차단 방지)"""
+        return await asyncio.to_thread(self.get, topic, domain, query_params)
+    
+    async def aset(self, topic: str, domain: str, value: str,
+                   expire_hours: int = 24, query_params: Dict = None) -> bool:
+        """비동기 캐시 저장 (파일/DB I/O를 스레드에서 수행하여 이벤트 루프 차단 방지)"""
+        return await asyncio.to_thread(self.set, topic, domain, value, expire_hours, query_params)
+    
     def _update_access_stats(self, key: str):
-        """접근 통계 업데이트"""
-        try:
-            with self._get_db_connection() as conn:
-                conn.execute("""
-                    UPDATE cache_entries 
-                    SET access_count = access_count + 1, last_accessed = ?
-                    WHERE key = ?
-                """, (datetime.now().isoformat(), key))
-                conn.commit()
-        except Exception as e:
-            print(f"❌ 접근 통계 업데이트 오류: {e}")
+        """접근 통계 업데이트 (버퍼에 기록 후 임계치/주기 도달 시 일괄 반영)"""
+        with self.lock:
+            delta, _ = self._pending_access.get(key, (0, None))
+            self._pending_access[key] = (delta + 1, datetime.now().isoformat())
+            
+            if (len(self._pending_access) >= self._pending_access_threshold or
+                    time.monotonic() - self._last_access_flush >= self._access_flush_interval):
+                self._flush_access_stats()
+    
+    def _flush_access_stats(self):
+        """버퍼링된 접근 통계를 단일 트랜잭션으로 반영"""
+        with self.lock:
+            self._last_access_flush = time.monotonic()
+            if not self._pending_access:
+                return
+            
+            pending = self._pending_access
+            self._pending_access = {}
+            
+            try:
+                with self._get_db_connection() as conn:
+                    conn.executemany("""
+                        UPDATE cache_entries 
+                        SET access_count = access_count + ?, last_accessed = ?
+                        WHERE key = ?
+                    """, [(delta, last_ts, key) for key, (delta, last_ts) in pending.items()])
+                    conn.commit()
+            except Exception as e:
+                print(f"❌ 접근 통계 업데이트 오류: {e}")
     
     def _delete_entry(self, key: str):
         """캐시 항목 삭제"""
+        with self.lock:
+            self._mem.pop(key, None)
+        
         try:
             with self._get_db_connection() as conn:
                 row = conn.execute(
@@ -258,8 +451,23 @@ class CacheManager:
         except Exception as e:
             print(f"❌ 만료된 캐시 정리 오류: {e}")
     
+    def _schedule_cleanup(self):
+        """다음 주기적 만료 항목 정리 예약"""
+        self._cleanup_timer = threading.Timer(self._cleanup_interval, self._periodic_cleanup)
+        self._cleanup_timer.daemon = True
+        self._cleanup_timer.start()
+    
+    def _periodic_cleanup(self):
+        """만료 항목 정리 후 다음 정리 예약"""
+        self._cleanup_expired()
+        with self.lock:
+            if self._conn is not None:
+                self._schedule_cleanup()
+    
     def _manage_cache_size(self):
         """캐시 크기 관리 (LRU 방식)"""
+        self._flush_access_stats()
+        
         try:
             with self._get_db_connection() as conn:
                 # 현재 캐시 크기 확인
@@ -272,27 +480,31 @@ class CacheManager:
                 
                 print(f"🗑️ 캐시 크기 초과 ({total_size / 1024 / 1024:.1f}MB), 정리 중...")
                 
-                # 가장 오래된 항목부터 삭제 (LRU)
+                # 가장 오래된 항목부터 삭제 대상 선정 (LRU, 80%까지 줄이기)
                 old_entries = conn.execute("""
-                    SELECT key, file_path FROM cache_entries 
+                    SELECT key, file_path, size_bytes FROM cache_entries 
                     ORDER BY last_accessed ASC
                 """).fetchall()
                 
+                target_size = self.max_size_bytes * 0.8
+                current_size = total_size
+                victims = []
                 for entry in old_entries:
-                    file_path = Path(entry['file_path'])
-                    if file_path.exists():
-                        file_path.unlink()
-                    
-                    conn.execute("DELETE FROM cache_entries WHERE key = ?", (entry['key'],))
-                    conn.commit()
-                    
-                    # 크기 재확인
-                    current_size = conn.execute(
-                        "SELECT SUM(size_bytes) FROM cache_entries"
-                    ).fetchone()[0] or 0
-                    
-                    if current_size <= self.max_size_bytes * 0.8:  # 80%까지 줄이기
+                    if current_size <= target_size:
                         break
+                    victims.append(entry)
+                    current_size -= entry['size_bytes'] or 0
+                
+                for entry in victims:
+                    Path(entry['file_path']).unlink(missing_ok=True)
+                    self._mem.pop(entry['key'], None)
+                
+                # 단일 트랜잭션으로 일괄 삭제
+                conn.executemany(
+                    "DELETE FROM cache_entries WHERE key = ?",
+                    [(entry['key'],) for entry in victims]
+                )
+                conn.commit()
                 
                 print(f"✅ 캐시 크기 정리 완료")
                 
@@ -303,6 +515,9 @@ class CacheManager:
         """모든 캐시 삭제"""
         try:
             with self.lock:
+                # 삭제될 항목의 접근 통계는 반영할 필요 없음
+                self._pending_access.clear()
+                
                 with self._get_db_connection() as conn:
                     entries = conn.execute("SELECT file_path FROM cache_entries").fetchall()
                     
@@ -313,6 +528,8 @@ class CacheManager:
                     
                     conn.execute("DELETE FROM cache_entries")
                     conn.commit()
+                
+                self._mem.clear()
                     
                 print("🗑️ 모든 캐시 삭제 완료")
                 
@@ -321,6 +538,8 @@ class CacheManager:
     
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계 조회"""
+        self._flush_access_stats()
+        
         try:
             with self._get_db_connection() as conn:
                 stats = conn.execute("""
@@ -6,17 +6,19 @@
 
 import os
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Dict, List
 import asyncio
 import traceback
 import time
+from contextlib import asynccontextmanager
 
 # 프로젝트 내부 모듈 임포트
-from agent_setup import agent_executor 
+from agent_setup import agent_executor, llm
+from cache_manager import cache_manager
 
 # .env 파일 로드: 환경 변수 (API 키 등) 불러옴
 load_dotenv() 
@@ -40,16 +42,59 @@ def check_api_key():
 check_api_key()
 
 # ─────────────────────────────────────────────
-# 3) FastAPI 애플리케이션 설정 및 CORS 미들웨어
+# 3) 서버 수명 주기, FastAPI 애플리케이션 설정 및 CORS 미들웨어
 # ─────────────────────────────────────────────
 
+# OpenAI 연결 예열 최대 대기 시간 (초)
+OPENAI_WARMUP_TIMEOUT = 5
+
+async def _warm_up_openai():
+    """OpenAI HTTP 연결 풀 예열: 첫 요청이 TCP/TLS 핸드셰이크 비용을 부담하지 않도록 함"""
+    try:
+        await asyncio.wait_for(llm.bind(max_tokens=1).ainvoke("ping"), timeout=OPENAI_WARMUP_TIMEOUT)
+        print("✅ 에이전트 초기화 및 OpenAI 연결 예열 완료")
+    except asyncio.TimeoutError:
+        print(f"⚠️ OpenAI 연결 예열 시간 초과 ({OPENAI_WARMUP_TIMEOUT}초, 첫 요청 시 연결)")
+    except Exception as e:
+        print(f"⚠️ OpenAI 연결 예열 실패 (첫 요청 시 연결): {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작/종료 시 실행되는 수명 주기 핸들러"""
+    print("🚀 AI 리서치 에이전트 API 서버가 시작되었습니다!")
+    print("📋 API 문서: http://127.0.0.1:8000/docs")
+    print("🔍 헬스 체크: http://127.0.0.1:8000/health")
+    
+    # HTML 파일 확인 (내용은 모듈 로드 시 _HTML_CONTENT에 이미 적재됨)
+    html_files = ['main.html', 'index.html', 'ai-research-agent.html']
+    found_files = [f for f in html_files if os.path.exists(f)]
+    
+    if found_files:
+        print(f"✅ HTML 파일 발견: {found_files}")
+    else:
+        print(f"⚠️ HTML 파일을 찾을 수 없습니다. 다음 중 하나를 추가하세요: {html_files}")
+    
+    # 에이전트 실행 제한 (세마포어/토큰 버킷) 생성
+    _init_agent_limits()
+    
+    # OpenAI HTTP 연결 풀 예열 (서버 시작을 기다리게 하지 않도록 백그라운드에서 실행)
+    warmup_task = asyncio.create_task(_warm_up_openai())
+    
+    yield
+    
+    print("🛑 AI 리서치 에이전트 API 서버가 종료됩니다.")
+    warmup_task.cancel()
+    cache_manager.close()
+
 # FastAPI 애플리케이션 초기화
 app = FastAPI(
     title="AI Research Agent API",
     description="전문 분야별 정보를 리서치하고 요약 보고서를 생성하는 API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # 긴 보고서 문자열을 빠르게 직렬화
+    lifespan=lifespan
 )
 
 # CORS 미들웨어 추가
@@ -66,15 +111,15 @@ app.add_middleware(
 # ─────────────────────────────────────────────
 
 # HTML 파일 읽기 함수
-def load_html_file():
-    """HTML 파일을 읽어서 반환"""
+def _resolve_html() -> bytes:
+    """HTML 파일을 읽어서 인코딩된 바이트로 반환 (시작 시 한 번만 호출)"""
     try:
         # 현재 디렉토리에서 HTML 파일 찾기
         possible_files = ['main.html', 'index.html', 'ai-research-agent.html']
         
         for filename in possible_files:
             if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8') as file:
+                with open(filename, 'rb') as file:
                     content = file.read()
                 print(f"✅ HTML 파일 로드 성공: {filename}")
                 return content
@@ -89,10 +134,13 @@ def load_html_file():
             <p><a href="/docs">API 문서 보기</a></p>
         </body>
         </html>
-        """
+        """.encode('utf-8')
     except Exception as e:
         print(f"❌ HTML 파일 읽기 실패: {e}")
-        return f"<html><body><h1>오류</h1><p>HTML 파일을 읽을 수 없습니다: {e}</p></body></html>"
+        return f"<html><body><h1>오류</h1><p>HTML 파일을 읽을 수 없습니다: {e}</p></body></html>".encode('utf-8')
+
+# 정적 HTML은 요청마다 디스크에서 읽지 않고 모듈 로드 시 한 번만 읽어 재사용
+_HTML_CONTENT: bytes = _resolve_html()
 
 # ─────────────────────────────────────────────
 # 5) Pydantic 모델 정의 (API 요청 및 응답 데이터 구조)
@@ -110,6 +158,124 @@ class ResearchResponse(BaseModel):
     report: str = Field(..., description="AI 에이전트가 생성한 리서치 보고서 내용")
     execution_time: Optional[float] = Field(None, description="실행 시간 (초)")
 
+# 일괄 리서치 요청당 최대 항목 수 (초과 시 요청 검증 단계에서 422 반환)
+BATCH_MAX_ITEMS = int(os.getenv("RESEARCH_BATCH_MAX_ITEMS", "10"))
+
+class BatchResearchRequest(BaseModel):
+    """일괄 리서치 요청 모델"""
+    items: List[ResearchRequest] = Field(
+        ..., max_length=BATCH_MAX_ITEMS, description=f"리서치 요청 목록 (최대 {BATCH_MAX_ITEMS}개)"
+    )
+
+class BatchResearchItem(BaseModel):
+    """일괄 리서치 개별 결과 모델"""
+    topic: str = Field(..., description="리서치 주제")
+    domain: str = Field(..., description="리서치 도메인")
+    status: str = Field(..., example="success", description="개별 리서치 결과 상태 (success/error)")
+    report: Optional[str] = Field(None, description="AI 에이전트가 생성한 리서치 보고서 내용")
+    error: Optional[str] = Field(None, description="실패 시 오류 메시지")
+
+class BatchResearchResponse(BaseModel):
+    """일괄 리서치 응답 모델"""
+    status: str = Field(..., example="success", description="API 호출 결과 상태")
+    results: List[BatchResearchItem] = Field(..., description="요청 순서대로 정렬된 개별 결과")
+    execution_time: Optional[float] = Field(None, description="전체 실행 시간 (초)")
+
+# ─────────────────────────────────────────────
+# 5-1) 에이전트 실행 헬퍼 (동일 요청 병합)
+# ─────────────────────────────────────────────
+
+class TokenBucket:
+    """분당 요청 수를 제한하는 토큰 버킷 (OpenAI 요청 한도 초과 방지)"""
+    
+    def __init__(self, rate_per_minute: int):
+        """
+        토큰 버킷 초기화
+        
+        Args:
+            rate_per_minute: 분당 허용 요청 수
+        """
+        self.capacity = max(1, rate_per_minute)
+        self.tokens = float(self.capacity)
+        self.refill_per_sec = self.capacity / 60.0
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """토큰 하나를 소비 (부족하면 충전될 때까지 대기)"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_sec)
+                self.updated_at = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self.tokens) / self.refill_per_sec)
+
+# 동시 에이전트 실행 수 및 분당 실행 수 제한 (이벤트 루프에 묶이므로 서버 시작 시 lifespan에서 생성)
+_agent_sem: Optional[asyncio.Semaphore] = None
+_agent_bucket: Optional[TokenBucket] = None
+
+def _init_agent_limits():
+    """서버 이벤트 루프에서 에이전트 실행 제한 객체 생성"""
+    global _agent_sem, _agent_bucket
+    _agent_sem = asyncio.Semaphore(int(os.getenv("AGENT_MAX_CONCURRENCY", "5")))
+    _agent_bucket = TokenBucket(int(os.getenv("AGENT_RATE_PER_MINUTE", "30")))
+
+# 진행 중인 에이전트 실행 (캐시 키 -> 실행 Task)
+# 조회와 등록 사이에 await가 없으므로 이벤트 루프 내에서 별도 잠금 없이 원자적으로 처리됨
+_inflight: Dict[str, asyncio.Task] = {}
+
+async def run_agent_deduplicated(topic: str, domain: str) -> str:
+    """
+    에이전트를 실행하되, 동일한 (주제, 도메인) 요청이 이미 실행 중이면 그 결과를 공유
+    
+    Args:
+        topic: 리서치 주제
+        domain: 리서치 도메인
+        
+    Returns:
+        에이전트가 생성한 보고서 내용
+    """
+    key = cache_manager._generate_cache_key(topic, domain)
+    
+    task = _inflight.get(key)
+    if task is not None:
+        print(f"🔗 동일한 요청이 실행 중 - 결과 공유 대기: {key[:8]}...")
+    else:
+        # 에이전트는 요청과 분리된 Task로 실행 (먼저 온 요청의 연결이 끊겨도 다른 대기자에게 결과 전달)
+        task = asyncio.create_task(_run_agent(topic, domain))
+        _inflight[key] = task
+        task.add_done_callback(lambda done: _finish_inflight(key, done))
+    
+    # 대기 중인 요청이 취소되어도 실행 Task는 취소되지 않도록 보호
+    return await asyncio.shield(task)
+
+def _finish_inflight(key: str, task: asyncio.Task):
+    """완료된 에이전트 실행을 진행 목록에서 제거 (대기자가 없을 때 예외 미회수 경고 방지)"""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()
+
+async def _run_agent(topic: str, domain: str) -> str:
+    """에이전트 실행 후 결과 캐싱 (동시 실행 수 및 요청 속도 제한)"""
+    # LangChain 에이전트 실행
+    async with _agent_sem:
+        await _agent_bucket.acquire()
+        result = await agent_executor.ainvoke({
+            "topic": topic, 
+            "domain": domain
+        })
+    report_content = result.get("output", "리서치 결과물을 찾을 수 없습니다.")
+    
+    # 다음 요청을 위해 결과 캐싱 (대기자에게 결과를 알리기 전에 저장)
+    await cache_manager.aset(topic, domain, report_content, expire_hours=24)
+    return report_content
+
 # ─────────────────────────────────────────────
 # 6) API 엔드포인트 정의
 # ─────────────────────────────────────────────
@@ -117,9 +283,8 @@ class ResearchResponse(BaseModel):
 # API 엔드포인트 정의
 @app.get("/", response_class=HTMLResponse)
 async def main_page():
-    """메인 HTML 인터페이스 페이지 - 외부 HTML 파일 사용"""
-    html_content = load_html_file()
-    return HTMLResponse(content=html_content)
+    """메인 HTML 인터페이스 페이지 - 시작 시 로드한 HTML 파일 사용"""
+    return HTMLResponse(content=_HTML_CONTENT)
 
 @app.get("/health")
 async def health_check():
@@ -131,7 +296,7 @@ async def health_check():
     }
 
 @app.post("/research", response_model=ResearchResponse)
-async def conduct_research(request: ResearchRequest):
+async def conduct_research(request: ResearchRequest, response: Response):
     """AI 에이전트가 리서치를 수행하고 보고서를 반환"""
     # API 키 확인
     if not os.getenv("OPENAI_API_KEY"):
@@ -150,21 +315,27 @@ async def conduct_research(request: ResearchRequest):
     # 실행 시간 측정 시작
     start_time = time.time()
     
+    # 캐시 확인: 히트 시 에이전트 실행 생략
+    cached_report = await cache_manager.aget(request.topic, request.domain)
+    if cached_report:
+        response.headers["X-Cache"] = "HIT"
+        return ResearchResponse(
+            status="success",
+            report=cached_report,
+            execution_time=round(time.time() - start_time, 2)
+        )
+    
+    response.headers["X-Cache"] = "MISS"
+    
     try:
         print(f"🔄 리서치 에이전트 실행 시작 - 주제: '{request.topic}', 도메인: '{request.domain}'")
         
-        # LangChain 에이전트 실행
-        result = await agent_executor.ainvoke({
-            "topic": request.topic, 
-            "domain": request.domain
-        })
+        # LangChain 에이전트 실행 (동일 요청 동시 실행 시 결과 공유)
+        report_content = await run_agent_deduplicated(request.topic, request.domain)
         
         # 실행 시간 계산
         execution_time = time.time() - start_time
         
-        # 결과 추출
-        report_content = result.get("output", "리서치 결과물을 찾을 수 없습니다.")
-        
         print(f"✅ 리서치 에이전트 실행 완료 - 보고서 길이: {len(report_content)} 문자, 실행 시간: {execution_time:.2f}초")
         
         return ResearchResponse(
@@ -183,41 +354,66 @@ async def conduct_research(request: ResearchRequest):
             detail=f"리서치 에이전트 실행 중 오류가 발생했습니다: {str(e)}"
         )
 
-# ─────────────────────────────────────────────
-# 7) 서버 시작/종료 이벤트 핸들러
-# ─────────────────────────────────────────────
-
-# 서버 시작 이벤트 핸들러
-@app.on_event("startup")
-async def startup_event():
-    """서버 시작 시 실행되는 이벤트"""
-    print("🚀 AI 리서치 에이전트 API 서버가 시작되었습니다!")
-    print("📋 API 문서: http://127.0.0.1:8000/docs")
-    print("🔍 헬스 체크: http://127.0.0.1:8000/health")
+@app.post("/research/batch", response_model=BatchResearchResponse)
+async def conduct_batch_research(request: BatchResearchRequest):
+    """여러 주제의 리서치를 동시에 수행하고 요청 순서대로 결과를 반환"""
+    # API 키 확인
+    if not os.getenv("OPENAI_API_KEY"):
+        raise HTTPException(
+            status_code=500, 
+            detail="OpenAI API 키가 설정되지 않았습니다."
+        )
     
-    # HTML 파일 확인
-    html_files = ['main.html', 'index.html', 'ai-research-agent.html']
-    found_files = [f for f in html_files if os.path.exists(f)]
+    if not request.items:
+        raise HTTPException(status_code=400, detail="리서치 요청 목록이 비어 있습니다.")
     
-    if found_files:
-        print(f"✅ HTML 파일 발견: {found_files}")
-    else:
-        print(f"⚠️ HTML 파일을 찾을 수 없습니다. 다음 중 하나를 추가하세요: {html_files}")
+    start_time = time.time()
     
-    # 에이전트 초기화 확인
-    try:
-        from agent_setup import agent_executor
-        print("✅ 에이전트 초기화 완료")
-    except Exception as e:
-        print(f"❌ 에이전트 초기화 실패: {e}")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """서버 종료 시 실행되는 이벤트"""
-    print("🛑 AI 리서치 에이전트 API 서버가 종료됩니다.")
+    async def research_one(item: ResearchRequest) -> str:
+        """개별 항목 리서치 (캐시 확인 후 에이전트 실행)"""
+        if not item.topic.strip():
+            raise ValueError("주제를 입력해주세요.")
+        if not item.domain.strip():
+            raise ValueError("도메인을 입력해주세요.")
+        
+        cached_report = await cache_manager.aget(item.topic, item.domain)
+        if cached_report:
+            return cached_report
+        
+        # 동시 실행 수는 run_agent_deduplicated 내부의 세마포어로 제한됨
+        return await run_agent_deduplicated(item.topic, item.domain)
+    
+    print(f"🔄 일괄 리서치 실행 시작 - {len(request.items)}개 항목")
+    
+    # 한 항목의 실패가 전체 일괄 처리를 중단시키지 않도록 예외를 결과로 수집
+    outcomes = await asyncio.gather(
+        *(research_one(item) for item in request.items),
+        return_exceptions=True
+    )
+    
+    results = []
+    for item, outcome in zip(request.items, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"❌ 일괄 리서치 항목 실패 - 주제: '{item.topic}': {outcome}")
+            results.append(BatchResearchItem(
+                topic=item.topic, domain=item.domain, status="error", error=str(outcome)
+            ))
+        else:
+            results.append(BatchResearchItem(
+                topic=item.topic, domain=item.domain, status="success", report=outcome
+            ))
+    
+    execution_time = time.time() - start_time
+    print(f"✅ 일괄 리서치 실행 완료 - {len(results)}개 항목, 실행 시간: {execution_time:.2f}초")
+    
+    return BatchResearchResponse(
+        status="success",
+        results=results,
+        execution_time=round(execution_time, 2)
+    )
 
 # ─────────────────────────────────────────────
-# 8) 서버 실행
+# 7) 서버 실행
 # ─────────────────────────────────────────────
 
 # 서버 실행
@@ -1,15 +1,47 @@
 # task_manager.py — AI 리서치 에이전트 작업 관리자 (개선 버전)
 
 import asyncio
+import atexit
+import bisect
+import gc
+import hashlib
+import logging
+import logging.handlers
+import os
+import queue
+import sys
 import uuid
-import json
+import orjson
+import sqlite3
+import threading
+import time
 import traceback
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 
+# ─────────────────────────────────────────────
+# 0) 로깅 설정 (출력은 백그라운드 스레드에서 수행)
+# ─────────────────────────────────────────────
+
+logger = logging.getLogger("task_manager")
+
+if not logger.handlers:
+    # 코루틴은 로그 레코드를 큐에 넣기만 하고, 실제 stdout 기록은 리스너 스레드가 담당
+    _log_queue: queue.Queue = queue.Queue(-1)
+    _stream_handler = logging.StreamHandler(sys.stdout)
+    _stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _log_listener = logging.handlers.QueueListener(_log_queue, _stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
 # ─────────────────────────────────────────────
 # 1) 작업 상태 및 데이터 클래스
 # ─────────────────────────────────────────────
@@ -22,7 +54,18 @@ class TaskStatus(Enum):
     FAILED = "failed"          # 실패
     CANCELLED = "cancelled"     # 취소됨
 
-@dataclass
+# 작업 진행 단계 (모든 작업이 같은 문자열 객체를 공유하도록 intern)
+STEP_SEARCH_QUERY = sys.intern("검색 쿼리 생성 중...")
+STEP_WEB_SEARCH = sys.intern("웹 검색 수행 중...")
+STEP_ANALYSIS = sys.intern("정보 수집 및 분석 중...")
+STEP_REPORT = sys.intern("보고서 작성 중...")
+STEP_REVIEW = sys.intern("최종 검토 중...")
+STEP_DONE = sys.intern("완료")
+STEP_CANCELLED = sys.intern("취소됨")
+STEP_FAILED = sys.intern("실패")
+
+# __slots__로 인스턴스별 __dict__를 없애 작업당 메모리를 줄임
+@dataclass(slots=True)
 class TaskInfo:
     """작업 정보를 저장하는 데이터 클래스"""
     task_id: str
@@ -39,38 +82,105 @@ class TaskInfo:
     execution_time: Optional[float] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환 (JSON 직렬화용)"""
+        """딕셔너리로 변환 (저장/JSON 직렬화용, asdict의 필드 재귀 복사 없이 직접 구성)"""
         return {
-            **asdict(self),
+            'task_id': self.task_id,
+            'topic': self.topic,
+            'domain': self.domain,
             'status': self.status.value,
             'created_at': self.created_at.isoformat(),
             'started_at': self.started_at.isoformat() if self.started_at else None,
             'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'progress': self.progress,
+            'current_step': self.current_step,
+            'result': self.result,
+            'error': self.error,
+            'execution_time': self.execution_time,
         }
 
 # ─────────────────────────────────────────────
 # 2) 작업 관리자 클래스
 # ─────────────────────────────────────────────
 
+# 종료 상태 (메모리 한도 초과 시 제외 대상)
+_FINISHED_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+# 항상 메모리에 유지하는 메타데이터 컬럼 (결과 본문 result는 필요할 때 데이터베이스에서 조회)
+_META_COLUMNS = (
+    "task_id, topic, domain, status, created_at, started_at, completed_at, "
+    "progress, current_step, error, execution_time"
+)
+
 class TaskManager:
     """AI 리서치 에이전트를 위한 작업 관리자"""
     
-    def __init__(self, max_concurrent_tasks: int = 5):
+    def __init__(self, max_concurrent_tasks: int = 5, queue_timeout: float = 30,
+                 flush_interval: float = 0.5, result_cache_ttl: float = 3600,
+                 max_live_tasks: int = 1000, cleanup_interval: float = 3600,
+                 result_cache_size: int = 128):
         """
         작업 관리자 초기화
         
         Args:
             max_concurrent_tasks: 최대 동시 실행 작업 수
+            queue_timeout: 대기열이 가득 찼을 때 start_task가 자리를 기다리는 최대 시간 (초), 초과 시 작업 실패 처리
+                (대기열에 들어간 작업은 실행 시간이 긴 앞선 작업을 기다리더라도 실패시키지 않음)
+            flush_interval: 진행 상황 변경분을 모아서 저장하는 주기 (초)
+            result_cache_ttl: 동일 주제/도메인 에이전트 결과 재사용 기간 (초)
+            max_live_tasks: 메모리에 유지할 최대 작업 수 (초과 시 오래 조회되지 않은 종료 작업부터 제외)
+            cleanup_interval: 오래된 작업 자동 정리 주기 (초)
+            result_cache_size: 결과 캐시에 유지할 최대 보고서 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
         """
-        self.tasks: Dict[str, TaskInfo] = {}
+        # 메모리 작업 목록 (LRU 순서, 제외된 작업은 데이터베이스에서 다시 로드)
+        self.tasks: "OrderedDict[str, TaskInfo]" = OrderedDict()
+        self.max_live_tasks = max_live_tasks
         self.running_tasks: Dict[str, asyncio.Task] = {}
         self.max_concurrent_tasks = max_concurrent_tasks
+        self.queue_timeout = queue_timeout
         
-        # 작업 저장 디렉토리 생성
+        # 작업 대기열 + 워커 풀: max_concurrent_tasks 개의 워커가 대기열에서 작업을 꺼내 실행
+        # (워커는 첫 작업 시작 시 생성, 대기열이 가득 차면 start_task가 queue_timeout까지 대기)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent_tasks * 4)
+        self._queued: set = set()
+        self._workers: Dict[int, asyncio.Task] = {}
+        self._idle_workers: set = set()
+        
+        # 진행 상황 저장 병합: 변경된 작업 ID를 모아 주기적으로 한 번만 저장
+        self.flush_interval = flush_interval
+        self._dirty: set = set()
+        self._flusher_task: Optional[asyncio.Task] = None
+        # 병합 저장과 즉시 저장의 기록 순서 보장용 (오래된 스냅샷이 나중에 기록되는 것 방지)
+        self._write_lock = asyncio.Lock()
+        # 실행 중인 작업별 진행 상황 저장 요청 큐 (작업당 하나의 저장 워커가 소비)
+        self._progress_queues: Dict[str, asyncio.Queue] = {}
+        
+        # 작업 인덱스: 상태별 작업 ID 집합, 생성 시각 순 정렬 목록 [(created_at, task_id)]
+        self._by_status: Dict[TaskStatus, set] = {status: set() for status in TaskStatus}
+        self._by_created: List[tuple] = []
+        
+        # 오래된 작업 주기적 정리 루프 (첫 작업 시작 시 실행)
+        self.cleanup_interval = cleanup_interval
+        self._cleanup_task: Optional[asyncio.Task] = None
+        
+        # 에이전트 결과 LRU 캐시: {키: (만료 시각, 결과 보고서)} - 작업 객체가 아닌 결과 문자열만 보관
+        self.result_cache_ttl = result_cache_ttl
+        self.result_cache_size = result_cache_size
+        self._result_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        
+        # 작업 통계 집계 (상태 전환 시 갱신하여 통계 조회를 O(1)로 유지)
+        self._exec_time_sum = 0.0
+        self._completed_count = 0
+        
+        # 작업 저장 디렉토리 및 SQLite 데이터베이스 (WAL 모드 영구 연결)
         self.storage_dir = Path("task_storage")
         self.storage_dir.mkdir(exist_ok=True)
+        self.db_path = self.storage_dir / "tasks.db"
+        self.db_lock = threading.RLock()
+        self._conn = self._open_connection()
+        self._init_database()
+        atexit.register(self.close)
         
-        print(f"📋 작업 관리자 초기화 완료 - 최대 동시 작업: {max_concurrent_tasks}개")
+        logger.info(f"📋 작업 관리자 초기화 완료 - 최대 동시 작업: {max_concurrent_tasks}개")
     
     def create_task(self, topic: str, domain: str) -> str:
         """
@@ -87,20 +197,86 @@ class TaskManager:
         task_info = TaskInfo(
             task_id=task_id,
             topic=topic,
-            domain=domain,
+            domain=sys.intern(domain),
             status=TaskStatus.PENDING,
             created_at=datetime.now()
         )
         
-        self.tasks[task_id] = task_info
+        self._add_task(task_info)
         self._save_task(task_info)
         
-        print(f"📝 새 작업 생성: {task_id[:8]}... (주제: {topic})")
+        logger.info(f"📝 새 작업 생성: {task_id[:8]}... (주제: {topic})")
         return task_id
     
+    def _count_completed(self, task_info: TaskInfo, sign: int):
+        """완료 작업 집계에 반영 (실행 시간이 있는 완료 작업만 평균에 포함)"""
+        if task_info.status == TaskStatus.COMPLETED and task_info.execution_time:
+            self._completed_count += sign
+            self._exec_time_sum += sign * task_info.execution_time
+    
+    def _is_indexed(self, task_id: str) -> bool:
+        """작업이 인덱스에 등록되어 있는지 확인 (메모리에서 제외된 작업 포함)"""
+        return any(task_id in task_ids for task_ids in self._by_status.values())
+    
+    def _cache_task(self, task_info: TaskInfo):
+        """작업을 메모리 LRU 목록에 넣고 한도 초과 시 종료된 작업부터 메모리에서 제외"""
+        self.tasks[task_info.task_id] = task_info
+        self.tasks.move_to_end(task_info.task_id)
+        self._evict_finished_tasks(keep=task_info.task_id)
+    
+    def _evict_finished_tasks(self, keep: Optional[str] = None):
+        """메모리 작업 수가 한도 이하가 될 때까지 오래 조회되지 않은 종료 작업부터 제외"""
+        if len(self.tasks) <= self.max_live_tasks:
+            return
+        # 대기/실행 중인 작업은 제외 대상이 아님 (종료 작업은 저장이 끝난 뒤에만 제외)
+        victims = []
+        excess = len(self.tasks) - self.max_live_tasks
+        for task_id, cached in self.tasks.items():
+            if len(victims) >= excess:
+                break
+            if (cached.status in _FINISHED_STATUSES and task_id not in self.running_tasks
+                    and task_id not in self._dirty and task_id != keep):
+                victims.append(task_id)
+        for task_id in victims:
+            del self.tasks[task_id]
+    
+    def _add_task(self, task_info: TaskInfo):
+        """작업을 목록에 추가하고 통계 집계에 반영"""
+        if self._is_indexed(task_info.task_id):
+            self._remove_task(task_info.task_id)
+        
+        self._cache_task(task_info)
+        self._by_status[task_info.status].add(task_info.task_id)
+        bisect.insort(self._by_created, (task_info.created_at, task_info.task_id))
+        self._count_completed(task_info, 1)
+    
+    def _remove_task(self, task_id: str):
+        """작업을 목록에서 제거하고 통계 집계에서 제외"""
+        task_info = self.tasks.pop(task_id, None) or self._load_task(task_id)
+        if task_info is None:
+            return
+        self._by_status[task_info.status].discard(task_id)
+        entry = (task_info.created_at, task_id)
+        index = bisect.bisect_left(self._by_created, entry)
+        if index < len(self._by_created) and self._by_created[index] == entry:
+            del self._by_created[index]
+        self._count_completed(task_info, -1)
+    
+    def _set_status(self, task_info: TaskInfo, new_status: TaskStatus):
+        """
+        작업 상태 전환 (통계 집계를 함께 갱신)
+        
+        완료로 전환하는 경우 execution_time을 먼저 설정한 뒤 호출해야 평균 실행 시간에 반영됨
+        """
+        self._by_status[task_info.status].discard(task_info.task_id)
+        self._count_completed(task_info, -1)
+        task_info.status = new_status
+        self._by_status[new_status].add(task_info.task_id)
+        self._count_completed(task_info, 1)
+    
     def get_task(self, task_id: str) -> Optional[TaskInfo]:
         """
-        작업 정보 조회
+        작업 정보 조회 (메모리에서 제외된 작업은 데이터베이스에서 다시 로드)
         
         Args:
             task_id: 작업 ID
@@ -108,72 +284,283 @@ class TaskManager:
         Returns:
             작업 정보 또는 None
         """
-        return self.tasks.get(task_id)
+        task_info = self.tasks.get(task_id)
+        if task_info is not None:
+            self.tasks.move_to_end(task_id)
+            return task_info
+        
+        if not self._is_indexed(task_id):
+            return None
+        task_info = self._load_task(task_id)
+        if task_info is not None:
+            self._cache_task(task_info)
+        return task_info
+    
+    def get_task_result(self, task_id: str) -> Optional[str]:
+        """
+        작업 결과 본문 조회 (메모리에 없으면 데이터베이스에서 읽음)
+        
+        Args:
+            task_id: 작업 ID
+            
+        Returns:
+            결과 보고서 또는 None
+        """
+        task_info = self.tasks.get(task_id)
+        if task_info is not None and task_info.result is not None:
+            return task_info.result
+        
+        try:
+            with self.db_lock:
+                row = self._conn.execute(
+                    "SELECT result FROM tasks WHERE task_id = ?", (task_id,)
+                ).fetchone()
+            return row["result"] if row else None
+            
+        except Exception as e:
+            logger.error(f"❌ 작업 결과 로드 오류 ({task_id}): {e}")
+            return None
     
     def get_all_tasks(self) -> Dict[str, TaskInfo]:
-        """모든 작업 조회"""
-        return self.tasks.copy()
+        """메모리에 있는 모든 작업 조회"""
+        return dict(self.tasks)
     
     def get_running_tasks(self) -> Dict[str, TaskInfo]:
         """실행 중인 작업 조회"""
         return {
-            task_id: task_info 
-            for task_id, task_info in self.tasks.items() 
-            if task_info.status == TaskStatus.RUNNING
+            task_id: self.tasks[task_id]
+            for task_id in self._by_status[TaskStatus.RUNNING]
+            if task_id in self.tasks
         }
     
     def update_task_progress(self, task_id: str, progress: int, current_step: str):
         """
-        작업 진행 상황 업데이트
+        작업 진행 상황 업데이트 (메모리만 갱신하고 저장은 작업별 저장 워커 또는 주기적 병합 저장에 맡김)
         
         Args:
             task_id: 작업 ID
             progress: 진행률 (0-100)
             current_step: 현재 단계 설명
         """
-        if task_id in self.tasks:
-            self.tasks[task_id].progress = min(100, max(0, progress))
-            self.tasks[task_id].current_step = current_step
+        task_info = self.tasks.get(task_id)
+        if task_info is not None:
+            task_info.progress = min(100, max(0, progress))
+            task_info.current_step = current_step
+            progress_queue = self._progress_queues.get(task_id)
+            if progress_queue is not None:
+                progress_queue.put_nowait(True)
+            else:
+                self._mark_dirty(task_id)
+            logger.info(f"📊 작업 진행: {task_id[:8]}... {progress}% - {current_step}")
+    
+    async def _progress_worker(self, task_info: TaskInfo, progress_queue: asyncio.Queue):
+        """
+        실행 중인 작업 하나의 진행 상황 저장 워커
+        
+        저장 중 쌓인 요청은 한 번의 저장으로 병합하고, None을 받으면 종료 (최종 상태는 실행 코루틴이 저장)
+        """
+        while True:
+            stop = await progress_queue.get() is None
+            while not progress_queue.empty():
+                stop = progress_queue.get_nowait() is None or stop
+            if stop:
+                return
+            await self._save_task_now(task_info)
+    
+    def _mark_dirty(self, task_id: str):
+        """작업을 저장 대기 목록에 추가하고 필요 시 저장 루프 시작"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖에서 호출된 경우 즉시 저장
             self._save_task(self.tasks[task_id])
-            print(f"📊 작업 진행: {task_id[:8]}... {progress}% - {current_step}")
+            return
+        
+        self._dirty.add(task_id)
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = loop.create_task(self._flush_dirty_loop())
+    
+    async def _flush_dirty_loop(self):
+        """저장 대기 중인 작업이 없어질 때까지 flush_interval 마다 일괄 저장"""
+        while self._dirty:
+            await asyncio.sleep(self.flush_interval)
+            await self._flush_dirty()
+    
+    async def _flush_dirty(self):
+        """저장 대기 중인 작업 모두 저장"""
+        async with self._write_lock:
+            while self._dirty:
+                task_id = self._dirty.pop()
+                task_info = self.tasks.get(task_id)
+                if task_info:
+                    await self._save_task_async(task_info)
+    
+    async def _save_task_now(self, task_info: TaskInfo):
+        """대기 중인 병합 저장을 건너뛰고 즉시 저장 (상태 전환 시 사용)"""
+        async with self._write_lock:
+            self._dirty.discard(task_info.task_id)
+            await self._save_task_async(task_info)
+    
+    def _result_cache_key(self, topic: str, domain: str, agent_executor) -> str:
+        """주제, 도메인(공백/대소문자 정규화), 에이전트 구성으로 결과 캐시 키 생성"""
+        tool_names = ",".join(tool.name for tool in getattr(agent_executor, "tools", None) or [])
+        agent_sig = f"{type(agent_executor).__name__}:{tool_names}"
+        topic_key = topic.strip().casefold()
+        domain_key = domain.strip().casefold()
+        return hashlib.sha256(f"{topic_key}|{domain_key}|{agent_sig}".encode("utf-8")).hexdigest()
     
-    async def start_task(self, task_id: str, agent_executor) -> asyncio.Task:
+    def _get_cached_result(self, key: str) -> Optional[str]:
+        """만료되지 않은 캐시 결과 조회"""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, output = entry
+        if expires_at < time.monotonic():
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return output
+    
+    def _set_cached_result(self, key: str, output: str):
+        """결과 캐시에 저장 (만료된 항목은 이때 함께 정리, 용량 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        now = time.monotonic()
+        expired_keys = [k for k, (expires_at, _) in self._result_cache.items() if expires_at < now]
+        for k in expired_keys:
+            del self._result_cache[k]
+        self._result_cache[key] = (now + self.result_cache_ttl, output)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+    
+    def _ensure_workers(self):
+        """워커 수를 max_concurrent_tasks에 맞춰 부족한 워커 생성"""
+        for index in range(self.max_concurrent_tasks):
+            worker = self._workers.get(index)
+            if worker is None or worker.done():
+                self._workers[index] = asyncio.create_task(self._worker_loop(index))
+    
+    async def _worker_loop(self, index: int):
+        """대기열에서 작업을 하나씩 꺼내 실행 (한도가 줄어 번호가 범위를 벗어나면 종료)"""
+        while index < self.max_concurrent_tasks:
+            self._idle_workers.add(index)
+            try:
+                task_id, agent_executor = await self._queue.get()
+            finally:
+                self._idle_workers.discard(index)
+            
+            try:
+                await self._run_queued_task(task_id, agent_executor)
+            except Exception as e:
+                logger.error(f"❌ 작업 실행 오류 ({task_id[:8]}...): {e}")
+            finally:
+                self._queue.task_done()
+    
+    async def _run_queued_task(self, task_id: str, agent_executor):
+        """대기열에서 꺼낸 작업 실행 (대기 중 취소된 작업은 실행하지 않음)"""
+        self._queued.discard(task_id)
+        task_info = self.get_task(task_id)
+        if task_info is None or task_info.status != TaskStatus.PENDING:
+            return
+        
+        # 실행 중 취소할 수 있도록 작업 단위 Task로 실행 (동시 실행 수는 워커 수로 제한됨)
+        async_task = asyncio.create_task(self._run_research_task(task_id, agent_executor))
+        self.running_tasks[task_id] = async_task
+        try:
+            await async_task
+        except asyncio.CancelledError:
+            # 작업 Task의 취소는 워커까지 전파하지 않음 (첫 실행 전에 취소되면 작업 내부의 취소 처리가 실행되지 않음)
+            if not async_task.cancelled():
+                raise
+            if task_info.status not in _FINISHED_STATUSES:
+                await self._mark_cancelled(task_info)
+        finally:
+            self._forget_task(task_id)
+            # 종료 후 저장까지 끝난 작업이 생겼으므로 메모리 한도 초과분 정리
+            self._evict_finished_tasks()
+    
+    async def _mark_cancelled(self, task_info: TaskInfo):
+        """실행 시작 전에 취소된 작업 취소 처리"""
+        self._set_status(task_info, TaskStatus.CANCELLED)
+        task_info.completed_at = datetime.now()
+        task_info.current_step = STEP_CANCELLED
+        await self._save_task_now(task_info)
+        logger.info(f"🚫 작업 취소: {task_info.task_id[:8]}...")
+    
+    async def _fail_queue_timeout(self, task_info: TaskInfo):
+        """대기열 등록 대기 시간 초과로 작업 실패 처리"""
+        self._set_status(task_info, TaskStatus.FAILED)
+        task_info.completed_at = datetime.now()
+        task_info.error = f"작업 대기열 등록 시간 초과 ({self.queue_timeout}초)"
+        task_info.current_step = STEP_FAILED
+        await self._save_task_now(task_info)
+        logger.warning(f"⏰ 작업 대기 시간 초과: {task_info.task_id[:8]}...")
+        self._evict_finished_tasks()
+    
+    async def set_max_concurrent_tasks(self, max_concurrent_tasks: int):
         """
-        작업 시작
+        최대 동시 실행 작업 수 변경
+        
+        Args:
+            max_concurrent_tasks: 새 최대 동시 실행 작업 수
+        """
+        self.max_concurrent_tasks = max_concurrent_tasks
+        if self._workers:
+            # 늘어난 경우 워커 추가, 줄어든 경우 유휴 워커는 바로 종료 (실행 중인 워커는 작업 후 종료)
+            self._ensure_workers()
+            for index, worker in self._workers.items():
+                if index >= max_concurrent_tasks and index in self._idle_workers:
+                    worker.cancel()
+        logger.info(f"🎛️ 최대 동시 작업 수 변경: {max_concurrent_tasks}개")
+    
+    async def start_task(self, task_id: str, agent_executor):
+        """
+        작업 시작 (대기열에 넣고 바로 반환, 빈 워커가 꺼내 실행)
         
         Args:
             task_id: 작업 ID
             agent_executor: 에이전트 실행기
             
-        Returns:
-            비동기 작업 객체
-            
         Raises:
             ValueError: 작업이 존재하지 않거나 실행할 수 없는 상태
         """
-        if task_id not in self.tasks:
+        task_info = self.get_task(task_id)
+        if task_info is None:
             raise ValueError(f"작업 {task_id}을(를) 찾을 수 없습니다.")
         
-        if len(self.running_tasks) >= self.max_concurrent_tasks:
-            raise ValueError(f"최대 동시 실행 작업 수({self.max_concurrent_tasks})에 도달했습니다.")
-        
-        task_info = self.tasks[task_id]
-        if task_info.status != TaskStatus.PENDING:
+        if (task_info.status != TaskStatus.PENDING or task_id in self.running_tasks
+                or task_id in self._queued):
             raise ValueError(f"작업 {task_id}은(는) 대기 상태가 아닙니다. 현재 상태: {task_info.status.value}")
         
-        # 작업 시작
-        task_info.status = TaskStatus.RUNNING
-        task_info.started_at = datetime.now()
-        self._save_task(task_info)
+        self._ensure_workers()
+        self._ensure_cleanup_loop()
         
-        # 비동기 작업 실행
-        async_task = asyncio.create_task(
-            self._run_research_task(task_id, agent_executor)
-        )
-        self.running_tasks[task_id] = async_task
+        # 대기열에 추가 (가득 찬 경우 queue_timeout까지 대기 후 실패 처리)
+        self._queued.add(task_id)
+        try:
+            await asyncio.wait_for(
+                self._queue.put((task_id, agent_executor)),
+                timeout=self.queue_timeout
+            )
+        except asyncio.TimeoutError:
+            self._queued.discard(task_id)
+            await self._fail_queue_timeout(task_info)
+            return
         
-        print(f"🚀 작업 시작: {task_id[:8]}... (주제: {task_info.topic})")
-        return async_task
+        logger.info(f"🚀 작업 제출: {task_id[:8]}... (주제: {task_info.topic})")
+    
+    def _ensure_cleanup_loop(self):
+        """오래된 작업 정리 루프가 없으면 시작"""
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+    
+    async def _cleanup_loop(self):
+        """cleanup_interval 마다 오래된 작업 정리"""
+        while True:
+            await asyncio.sleep(self.cleanup_interval)
+            try:
+                self.cleanup_old_tasks()
+            except Exception as e:
+                logger.error(f"❌ 오래된 작업 자동 정리 오류: {e}")
     
     async def _run_research_task(self, task_id: str, agent_executor):
         """
@@ -184,77 +571,103 @@ class TaskManager:
             agent_executor: 에이전트 실행기
         """
         task_info = self.tasks[task_id]
-        start_time = datetime.now()
+        
+        # 진행 상황 저장 워커 시작 (작업이 끝날 때까지 하나만 유지)
+        progress_queue: asyncio.Queue = asyncio.Queue()
+        self._progress_queues[task_id] = progress_queue
+        progress_worker = asyncio.create_task(self._progress_worker(task_info, progress_queue))
+        
+        # 실행 시간은 단조 증가 시계로 측정
+        start_time = time.perf_counter()
         
         try:
+            # 작업 시작 (시작 저장 중 취소되어도 아래 취소 처리와 정리가 실행되도록 try 안에서 수행)
+            self._set_status(task_info, TaskStatus.RUNNING)
+            task_info.started_at = datetime.now()
+            await self._save_task_now(task_info)
+            logger.info(f"🚀 작업 시작: {task_id[:8]}... (주제: {task_info.topic})")
+            
             # 단계별 진행 상황 업데이트
-            self.update_task_progress(task_id, 10, "검색 쿼리 생성 중...")
-            await asyncio.sleep(0.1)  # 상태 업데이트 시간
+            self.update_task_progress(task_id, 10, STEP_SEARCH_QUERY)
             
-            self.update_task_progress(task_id, 20, "웹 검색 수행 중...")
-            await asyncio.sleep(0.1)
+            self.update_task_progress(task_id, 20, STEP_WEB_SEARCH)
             
-            self.update_task_progress(task_id, 40, "정보 수집 및 분석 중...")
+            self.update_task_progress(task_id, 40, STEP_ANALYSIS)
             
-            # 에이전트 실행
-            result = await agent_executor.ainvoke({
-                "topic": task_info.topic,
-                "domain": task_info.domain
-            })
+            # 에이전트 실행 (같은 주제/도메인의 최근 결과가 있으면 재사용)
+            cache_key = self._result_cache_key(task_info.topic, task_info.domain, agent_executor)
+            output = self._get_cached_result(cache_key)
+            if output is not None:
+                logger.info(f"💾 캐시된 결과 사용: {task_id[:8]}...")
+            else:
+                result = await agent_executor.ainvoke({
+                    "topic": task_info.topic,
+                    "domain": task_info.domain
+                })
+                output = result.get("output")
+                # 에이전트 응답(중간 단계 포함)은 출력만 꺼낸 뒤 바로 해제
+                result = None
+                if output is not None:
+                    self._set_cached_result(cache_key, output)
             
-            self.update_task_progress(task_id, 80, "보고서 작성 중...")
-            await asyncio.sleep(0.1)
+            self.update_task_progress(task_id, 80, STEP_REPORT)
             
-            self.update_task_progress(task_id, 90, "최종 검토 중...")
-            await asyncio.sleep(0.1)
+            self.update_task_progress(task_id, 90, STEP_REVIEW)
             
             # 작업 완료
             end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
-            task_info.status = TaskStatus.COMPLETED
             task_info.completed_at = end_time
             task_info.progress = 100
-            task_info.current_step = "완료"
-            task_info.result = result.get("output", "결과를 찾을 수 없습니다.")
+            task_info.current_step = STEP_DONE
+            task_info.result = output if output is not None else "결과를 찾을 수 없습니다."
             task_info.execution_time = execution_time
+            self._set_status(task_info, TaskStatus.COMPLETED)
             
-            self._save_task(task_info)
+            await self._save_task_now(task_info)
+            # 결과 본문은 저장 후 메모리에서 해제 (get_task_result로 조회)
+            task_info.result = None
             
-            print(f"✅ 작업 완료: {task_id[:8]}... (실행 시간: {execution_time:.2f}초)")
+            logger.info(f"✅ 작업 완료: {task_id[:8]}... (실행 시간: {execution_time:.2f}초)")
             
         except asyncio.CancelledError:
             # 작업 취소됨
-            task_info.status = TaskStatus.CANCELLED
+            self._set_status(task_info, TaskStatus.CANCELLED)
             task_info.completed_at = datetime.now()
-            task_info.current_step = "취소됨"
-            task_info.execution_time = (datetime.now() - start_time).total_seconds()
+            task_info.current_step = STEP_CANCELLED
+            task_info.execution_time = time.perf_counter() - start_time
             
-            self._save_task(task_info)
-            print(f"🚫 작업 취소: {task_id[:8]}...")
+            await self._save_task_now(task_info)
+            logger.info(f"🚫 작업 취소: {task_id[:8]}...")
             
         except Exception as e:
             # 작업 실패
             end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
-            task_info.status = TaskStatus.FAILED
+            self._set_status(task_info, TaskStatus.FAILED)
             task_info.completed_at = end_time
             task_info.error = str(e)
-            task_info.current_step = "실패"
+            task_info.current_step = STEP_FAILED
             task_info.execution_time = execution_time
             
-            self._save_task(task_info)
+            await self._save_task_now(task_info)
             
             # 상세한 오류 로그
             error_trace = traceback.format_exc()
-            print(f"❌ 작업 실패: {task_id[:8]}... - {str(e)}")
-            print(f"📋 오류 상세:\n{error_trace}")
+            logger.error(f"❌ 작업 실패: {task_id[:8]}... - {str(e)}")
+            logger.error(f"📋 오류 상세:\n{error_trace}")
             
         finally:
-            # 실행 중인 작업 목록에서 제거
-            if task_id in self.running_tasks:
-                del self.running_tasks[task_id]
+            # 진행 상황 저장 워커 종료 (실행 중인 작업 목록에서는 _run_queued_task가 제거)
+            del self._progress_queues[task_id]
+            progress_queue.put_nowait(None)
+            await progress_worker
+    
+    def _forget_task(self, task_id: str):
+        """완료된 비동기 작업 객체 참조 해제 (코루틴 프레임과 결과가 남아있지 않도록 함)"""
+        self.running_tasks.pop(task_id, None)
     
     def cancel_task(self, task_id: str) -> bool:
         """
@@ -268,62 +681,178 @@ class TaskManager:
         """
         if task_id in self.running_tasks:
             self.running_tasks[task_id].cancel()
-            print(f"🚫 작업 취소 요청: {task_id[:8]}...")
+            logger.info(f"🚫 작업 취소 요청: {task_id[:8]}...")
             return True
         
         if task_id in self.tasks and self.tasks[task_id].status == TaskStatus.PENDING:
-            self.tasks[task_id].status = TaskStatus.CANCELLED
+            self._set_status(self.tasks[task_id], TaskStatus.CANCELLED)
             self.tasks[task_id].completed_at = datetime.now()
             self._save_task(self.tasks[task_id])
-            print(f"🚫 대기 중인 작업 취소: {task_id[:8]}...")
+            logger.info(f"🚫 대기 중인 작업 취소: {task_id[:8]}...")
             return True
         
         return False
     
-    def _save_task(self, task_info: TaskInfo):
-        """작업 정보를 파일에 저장"""
+    def _open_connection(self) -> sqlite3.Connection:
+        """WAL 모드 영구 연결 생성 (읽기가 쓰기를 막지 않도록 함)"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    def _init_database(self):
+        """작업 테이블 및 인덱스 생성"""
+        with self.db_lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    task_id TEXT PRIMARY KEY,
+                    topic TEXT,
+                    domain TEXT,
+                    status TEXT,
+                    created_at TIMESTAMP,
+                    started_at TIMESTAMP,
+                    completed_at TIMESTAMP,
+                    progress INTEGER DEFAULT 0,
+                    current_step TEXT,
+                    result TEXT,
+                    error TEXT,
+                    execution_time REAL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks(created_at)")
+            self._conn.commit()
+    
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self.db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def _write_task(self, data: Dict[str, Any]):
+        """직렬화된 작업 정보를 데이터베이스에 기록 (메모리에서 해제된 결과 본문은 기존 값 유지)"""
         try:
-            file_path = self.storage_dir / f"{task_info.task_id}.json"
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(task_info.to_dict(), f, ensure_ascii=False, indent=2)
+            with self.db_lock:
+                self._conn.execute("""
+                    INSERT INTO tasks
+                    (task_id, topic, domain, status, created_at, started_at, completed_at,
+                     progress, current_step, result, error, execution_time)
+                    VALUES (:task_id, :topic, :domain, :status, :created_at, :started_at, :completed_at,
+                            :progress, :current_step, :result, :error, :execution_time)
+                    ON CONFLICT(task_id) DO UPDATE SET
+                        topic = excluded.topic,
+                        domain = excluded.domain,
+                        status = excluded.status,
+                        created_at = excluded.created_at,
+                        started_at = excluded.started_at,
+                        completed_at = excluded.completed_at,
+                        progress = excluded.progress,
+                        current_step = excluded.current_step,
+                        result = COALESCE(excluded.result, tasks.result),
+                        error = excluded.error,
+                        execution_time = excluded.execution_time
+                """, data)
+                self._conn.commit()
         except Exception as e:
-            print(f"❌ 작업 저장 오류: {e}")
+            logger.error(f"❌ 작업 저장 오류: {e}")
+    
+    def _save_task(self, task_info: TaskInfo):
+        """작업 정보를 저장 (동기, 비동기 컨텍스트 밖의 호출용)"""
+        self._write_task(task_info.to_dict())
+    
+    async def _save_task_async(self, task_info: TaskInfo):
+        """작업 정보를 저장 (디스크 I/O를 스레드에서 수행해 이벤트 루프 차단 방지)"""
+        # 스냅샷은 이벤트 루프에서 만들어 기록 중 상태 변경과 섞이지 않도록 함
+        data = task_info.to_dict()
+        await asyncio.to_thread(self._write_task, data)
+    
+    def _task_from_dict(self, data: Dict[str, Any]) -> TaskInfo:
+        """저장된 딕셔너리(JSON/DB 행)를 TaskInfo로 변환"""
+        # 날짜 문자열을 datetime으로 변환
+        data['created_at'] = datetime.fromisoformat(data['created_at'])
+        if data['started_at']:
+            data['started_at'] = datetime.fromisoformat(data['started_at'])
+        if data['completed_at']:
+            data['completed_at'] = datetime.fromisoformat(data['completed_at'])
+        data['status'] = TaskStatus(data['status'])
+        # 도메인/진행 단계는 종류가 적으므로 intern하여 작업 간 같은 문자열 객체 공유
+        if data['domain']:
+            data['domain'] = sys.intern(data['domain'])
+        if data['current_step']:
+            data['current_step'] = sys.intern(data['current_step'])
+        
+        return TaskInfo(**data)
     
     def _load_task(self, task_id: str) -> Optional[TaskInfo]:
-        """파일에서 작업 정보 로드"""
+        """데이터베이스에서 작업 메타데이터 로드 (결과 본문은 get_task_result로 조회)"""
         try:
-            file_path = self.storage_dir / f"{task_id}.json"
-            if not file_path.exists():
-                return None
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with self.db_lock:
+                row = self._conn.execute(
+                    f"SELECT {_META_COLUMNS} FROM tasks WHERE task_id = ?", (task_id,)
+                ).fetchone()
+            return self._task_from_dict(dict(row)) if row else None
             
-            # 날짜 문자열을 datetime으로 변환
-            data['created_at'] = datetime.fromisoformat(data['created_at'])
-            if data['started_at']:
-                data['started_at'] = datetime.fromisoformat(data['started_at'])
-            if data['completed_at']:
-                data['completed_at'] = datetime.fromisoformat(data['completed_at'])
-            data['status'] = TaskStatus(data['status'])
-            
-            return TaskInfo(**data)
+        except Exception as e:
+            logger.error(f"❌ 작업 로드 오류 ({task_id}): {e}")
+            return None
+    
+    def _load_task_from_path(self, file_path: Path) -> Optional[TaskInfo]:
+        """이전 버전의 JSON 작업 파일에서 작업 정보 로드"""
+        try:
+            data = orjson.loads(file_path.read_bytes())
+            return self._task_from_dict(data)
             
         except Exception as e:
-            print(f"❌ 작업 로드 오류 ({task_id}): {e}")
+            logger.error(f"❌ 작업 로드 오류 ({file_path.stem}): {e}")
             return None
     
-    def load_all_tasks(self):
-        """모든 저장된 작업 로드"""
-        loaded_count = 0
+    def _migrate_json_tasks(self):
+        """이전 버전의 작업별 JSON 파일을 데이터베이스로 옮기고 파일 삭제"""
+        migrated_count = 0
         for json_file in self.storage_dir.glob("*.json"):
-            task_id = json_file.stem
-            task_info = self._load_task(task_id)
+            task_info = self._load_task_from_path(json_file)
             if task_info:
-                self.tasks[task_id] = task_info
+                self._save_task(task_info)
+                json_file.unlink(missing_ok=True)
+                migrated_count += 1
+        
+        if migrated_count:
+            logger.info(f"📦 JSON 작업 파일 {migrated_count}개를 데이터베이스로 이전 완료")
+    
+    def _load_all_rows(self) -> List[Optional[TaskInfo]]:
+        """데이터베이스의 모든 작업 메타데이터 로드 (결과 본문은 읽지 않음)"""
+        self._migrate_json_tasks()
+        
+        loaded_tasks = []
+        with self.db_lock:
+            rows = self._conn.execute(f"SELECT {_META_COLUMNS} FROM tasks").fetchall()
+        for row in rows:
+            try:
+                loaded_tasks.append(self._task_from_dict(dict(row)))
+            except Exception as e:
+                logger.error(f"❌ 작업 로드 오류 ({row['task_id']}): {e}")
+        return loaded_tasks
+    
+    def _register_loaded_tasks(self, loaded_tasks: List[Optional[TaskInfo]]):
+        """로드된 작업들을 목록에 추가"""
+        loaded_count = 0
+        for task_info in loaded_tasks:
+            if task_info:
+                self._add_task(task_info)
                 loaded_count += 1
         
-        print(f"📂 저장된 작업 {loaded_count}개 로드 완료")
+        logger.info(f"📂 저장된 작업 {loaded_count}개 로드 완료")
+    
+    def load_all_tasks(self):
+        """모든 저장된 작업 로드"""
+        self._register_loaded_tasks(self._load_all_rows())
+    
+    async def async_load_all_tasks(self):
+        """모든 저장된 작업 비동기 로드 (데이터베이스 조회를 스레드에서 수행)"""
+        loaded_tasks = await asyncio.to_thread(self._load_all_rows)
+        self._register_loaded_tasks(loaded_tasks)
     
     def cleanup_old_tasks(self, days: int = 7):
         """
@@ -333,77 +862,133 @@ class TaskManager:
             days: 보관 기간 (일)
         """
         cutoff_date = datetime.now() - timedelta(days=days)
-        tasks_to_remove = []
         
-        for task_id, task_info in self.tasks.items():
-            if task_info.created_at < cutoff_date:
-                tasks_to_remove.append(task_id)
+        # 생성 시각 정렬 인덱스에서 기준 시각 이전 범위만 추출 (전체 순회 없음)
+        cutoff_index = bisect.bisect_left(self._by_created, (cutoff_date,))
+        tasks_to_remove = [task_id for _, task_id in self._by_created[:cutoff_index]]
         
+        # 메모리에서 제거 (제외된 작업은 데이터베이스에서 읽어 집계를 되돌리므로 삭제 전에 수행)
         for task_id in tasks_to_remove:
-            # 파일 삭제
-            file_path = self.storage_dir / f"{task_id}.json"
-            if file_path.exists():
-                file_path.unlink()
-            
-            # 메모리에서 제거
-            del self.tasks[task_id]
+            self._remove_task(task_id)
         
-        print(f"🗑️ 오래된 작업 {len(tasks_to_remove)}개 정리 완료")
-    
-    def get_task_statistics(self) -> Dict[str, Any]:
-        """작업 통계 조회"""
-        total_tasks = len(self.tasks)
-        status_counts = {}
+        # 데이터베이스에서 일괄 삭제 (created_at 인덱스 범위 삭제)
+        try:
+            with self.db_lock:
+                self._conn.execute(
+                    "DELETE FROM tasks WHERE created_at < ?", (cutoff_date.isoformat(),)
+                )
+                self._conn.commit()
+        except Exception as e:
+            logger.error(f"❌ 오래된 작업 삭제 오류: {e}")
         
-        for status in TaskStatus:
-            status_counts[status.value] = sum(
-                1 for task in self.tasks.values() 
-                if task.status == status
-            )
+        # 이전 형식으로 남은 JSON 파일 정리 (이전 실패 등으로 데이터베이스에 옮겨지지 않은 파일)
+        self._remove_stale_json_files(cutoff_date.timestamp())
         
-        running_tasks = len(self.running_tasks)
+        # 대량 제거 후 순환 참조(취소/실패 작업의 예외-프레임 참조 등) 회수
+        if tasks_to_remove:
+            gc.collect()
+        
+        logger.info(f"🗑️ 오래된 작업 {len(tasks_to_remove)}개 정리 완료")
+    
+    def _remove_stale_json_files(self, cutoff_timestamp: float):
+        """
+        수정 시각이 기준 시각 이전인 JSON 작업 파일 삭제
+        
+        os.scandir의 디렉토리 항목 stat을 사용해 파일을 읽지 않고 수정 시각만으로 판단
+        """
+        removed_count = 0
+        try:
+            with os.scandir(self.storage_dir) as entries:
+                for entry in entries:
+                    if (entry.name.endswith(".json") and entry.is_file()
+                            and entry.stat().st_mtime < cutoff_timestamp):
+                        os.unlink(entry.path)
+                        removed_count += 1
+        except OSError as e:
+            logger.error(f"❌ 오래된 작업 파일 삭제 오류: {e}")
         
-        # 평균 실행 시간 계산
-        completed_tasks = [
-            task for task in self.tasks.values() 
-            if task.status == TaskStatus.COMPLETED and task.execution_time
-        ]
+        if removed_count:
+            logger.info(f"🗑️ 오래된 JSON 작업 파일 {removed_count}개 삭제")
+    
+    def get_task_statistics(self) -> Dict[str, Any]:
+        """작업 통계 조회"""
+        # 상태 전환 시 갱신된 집계값 사용 (전체 작업 순회 없음)
         avg_execution_time = (
-            sum(task.execution_time for task in completed_tasks) / len(completed_tasks)
-            if completed_tasks else 0
+            self._exec_time_sum / self._completed_count
+            if self._completed_count else 0
         )
         
         return {
-            "total_tasks": total_tasks,
-            "running_tasks": running_tasks,
-            "status_counts": status_counts,
+            "total_tasks": len(self._by_created),
+            "running_tasks": len(self.running_tasks),
+            "queued_tasks": len(self._queued),
+            "status_counts": {status.value: len(task_ids) for status, task_ids in self._by_status.items()},
             "max_concurrent_tasks": self.max_concurrent_tasks,
             "avg_execution_time": avg_execution_time,
-            "completed_tasks": len(completed_tasks)
+            "completed_tasks": self._completed_count
         }
     
     def get_recent_tasks(self, limit: int = 10) -> List[TaskInfo]:
-        """최근 작업 조회"""
-        sorted_tasks = sorted(
-            self.tasks.values(),
-            key=lambda x: x.created_at,
-            reverse=True
-        )
-        return sorted_tasks[:limit]
+        """최근 작업 조회 (생성 시각 정렬 인덱스의 끝에서 limit개만 읽음)"""
+        if limit <= 0:
+            return []
+        recent_tasks = (self.get_task(task_id) for _, task_id in reversed(self._by_created[-limit:]))
+        return [task_info for task_info in recent_tasks if task_info is not None]
 
 # ─────────────────────────────────────────────
 # 3) 전역 작업 관리자 인스턴스
 # ─────────────────────────────────────────────
 
-# 전역 작업 관리자 인스턴스 생성
-task_manager = TaskManager()
+# 전역 작업 관리자 인스턴스 (첫 사용 시 생성 및 기존 작업 로드, 임포트 시에는 디스크 접근 없음)
+_task_manager: Optional[TaskManager] = None
+_task_manager_lock = threading.Lock()
+# 비동기 최초 생성 직렬화용 (동시에 호출돼도 관리자 생성과 JSON 이전은 한 번만 수행)
+_task_manager_async_lock = asyncio.Lock()
+
+def get_task_manager() -> TaskManager:
+    """전역 작업 관리자 조회 (최초 호출 시 생성 후 저장된 작업 로드)"""
+    global _task_manager
+    if _task_manager is None:
+        with _task_manager_lock:
+            if _task_manager is None:
+                manager = TaskManager()
+                manager.load_all_tasks()
+                _task_manager = manager
+    return _task_manager
+
+async def async_get_task_manager() -> TaskManager:
+    """
+    전역 작업 관리자 비동기 조회
+    
+    asyncio 대기열/락이 현재 이벤트 루프에 묶이도록 관리자는 이벤트 루프 스레드에서 생성하고,
+    저장된 작업 로드(데이터베이스 조회)만 스레드에서 수행해 이벤트 루프 차단을 방지
+    """
+    global _task_manager
+    if _task_manager is not None:
+        return _task_manager
+    
+    async with _task_manager_async_lock:
+        if _task_manager is None:
+            manager = TaskManager()
+            await manager.async_load_all_tasks()
+            with _task_manager_lock:
+                # 다른 스레드의 get_task_manager가 먼저 생성했다면 그 인스턴스를 사용
+                if _task_manager is None:
+                    _task_manager = manager
+            if _task_manager is not manager:
+                manager.close()
+    return _task_manager
 
-# 시스템 시작 시 기존 작업 로드
-task_manager.load_all_tasks()
+def __getattr__(name: str):
+    """기존 `from task_manager import task_manager` 호환 (접근 시점에 생성)"""
+    if name == "task_manager":
+        return get_task_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # 모듈 임포트 시 정보 출력
 if __name__ == "__main__":
     print("📋 task_manager.py 실행됨")
+    task_manager = get_task_manager()
     print("📊 작업 관리자 준비 완료")
     
     # 통계 출력
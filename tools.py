@@ -1,17 +1,123 @@
 # tools.py — AI 리서치 에이전트 도구 모음
 
+import asyncio
+import functools
+import heapq
 import os
+import re
 import time
 import json
+import httpx
 import requests
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict, deque
+import threading
+from threading import Lock
+from typing import Any, List, Dict, Optional, Tuple
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup
 from langchain_core.tools import tool
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 
 # ─────────────────────────────────────────────
-# 1) 웹 스크래핑 메인 도구
+# 1) 공용 캐시, 요청 제한 및 요청 헤더
+# ─────────────────────────────────────────────
+
+class TTLCache:
+    """만료 시간이 있는 LRU 캐시 (여러 스레드에서 동시에 사용 가능)"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+            ttl: 기본 유효 기간 (초)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+    
+    def get(self, key, default=None):
+        """유효한 값 조회 (만료된 항목은 제거)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key, value, ttl: Optional[float] = None):
+        """값 저장 (ttl 미지정 시 기본 유효 기간 사용)"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+class HostRateLimiter:
+    """호스트별 요청 속도 제한기 (period초 동안 호스트당 최대 max_rate회, 이벤트 루프/스레드에 무관하게 공유 가능)"""
+    
+    def __init__(self, max_rate: int, period: float):
+        """
+        Args:
+            max_rate: period 동안 호스트별 최대 요청 수
+            period: 속도 제한 구간 (초)
+        """
+        self.max_rate = max_rate
+        self.period = period
+        self._requests: Dict[str, deque] = {}
+        self._lock = Lock()
+    
+    async def acquire(self, host: str):
+        """요청 시점을 예약하고 예약 시점까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            window_start = now - self.period
+            
+            # 마지막 예약이 구간을 벗어난 호스트는 제거 (최근 period초 안에 요청한 호스트만 유지)
+            stale_hosts = [h for h, times in self._requests.items() if times[-1] <= window_start]
+            for stale_host in stale_hosts:
+                del self._requests[stale_host]
+            
+            reserved = self._requests.setdefault(host, deque())
+            while reserved and reserved[0] <= window_start:
+                reserved.popleft()
+            start_at = now if len(reserved) < self.max_rate else reserved[-self.max_rate] + self.period
+            reserved.append(start_at)
+        
+        delay = start_at - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+# 비동기 스크래핑 제한 (동시 요청 수 + 호스트당 초당 요청 수, 같은 사이트에 몰려 429를 받지 않도록)
+SCRAPE_MAX_CONCURRENCY = 8
+SCRAPE_HOST_LIMITER = HostRateLimiter(max_rate=5, period=1.0)
+
+# 스크래핑 결과 캐시 (URL 기준, 실패 결과는 짧은 기간만 보관)
+SCRAPE_CACHE = TTLCache(maxsize=512, ttl=3600)
+SCRAPE_ERROR_TTL = 60
+
+# 검색 결과 캐시 (검색 제공자 + 정규화된 검색어 기준, 오류 결과는 저장하지 않음)
+SEARCH_CACHE = TTLCache(maxsize=128, ttl=900)
+
+# 웹페이지 요청 헤더
+SCRAPE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# ─────────────────────────────────────────────
+# 2) 웹 스크래핑 메인 도구
 # ─────────────────────────────────────────────
 
 @tool
@@ -26,24 +132,37 @@ def web_scraper_tool(query: str) -> str:
         # 검색 방법 우선순위
         if os.getenv("SERPAPI_API_KEY"):
             print("📡 SerpAPI 사용 중...")
-            return search_with_serpapi(query)
+            provider, search_fn = "serpapi", search_with_serpapi
         elif os.getenv("GOOGLE_API_KEY") and os.getenv("GOOGLE_CSE_ID"):
             print("🔍 Google Custom Search API 사용 중...")
-            return search_with_google_cse(query)
+            provider, search_fn = "google_cse", search_with_google_cse
         else:
             print("🦆 DuckDuckGo 검색 사용 중...")
-            return search_with_duckduckgo(query)
+            provider, search_fn = "duckduckgo", search_with_duckduckgo
+        
+        # 같은(정규화 기준) 검색어의 최근 결과가 있으면 검색 파이프라인 전체를 건너뜀
+        cache_key = (provider, query.strip().casefold())
+        cached = SEARCH_CACHE.get(cache_key)
+        if cached is not None:
+            print(f"💾 검색 캐시 사용: '{query}'")
+            return cached
+        
+        # 실제 검색 결과만 캐시 (오류/결과 없음/폴백 안내는 다음 호출에서 다시 검색)
+        result, success = search_fn(query)
+        if success:
+            SEARCH_CACHE.set(cache_key, result)
+        return result
             
     except Exception as e:
         print(f"❌ 웹 검색 도구 전체 오류: {str(e)}")
         return f"❌ 웹 검색 중 오류 발생: {str(e)}"
 
 # ─────────────────────────────────────────────
-# 2) 검색 방법별 구현
+# 3) 검색 방법별 구현
 # ─────────────────────────────────────────────
 
-def search_with_serpapi(query: str) -> str:
-    """SerpAPI를 사용한 Google 검색"""
+def search_with_serpapi(query: str) -> Tuple[str, bool]:
+    """SerpAPI를 사용한 Google 검색 (검색 결과 또는 안내 메시지, 실제 검색 결과 여부 반환)"""
     try:
         from serpapi import GoogleSearch
         
@@ -59,17 +178,17 @@ def search_with_serpapi(query: str) -> str:
         organic_results = results.get("organic_results", [])
         
         if not organic_results:
-            return f"🔍 '{query}'에 대한 검색 결과를 찾을 수 없습니다."
+            return f"🔍 '{query}'에 대한 검색 결과를 찾을 수 없습니다.", False
         
-        return process_search_results(organic_results, query)
+        return process_search_results(organic_results, query), True
         
     except ImportError:
-        return "❌ SerpAPI 사용을 위해 'google-search-results' 패키지를 설치해주세요:\npip install google-search-results"
+        return "❌ SerpAPI 사용을 위해 'google-search-results' 패키지를 설치해주세요:\npip install google-search-results", False
     except Exception as e:
-        return f"❌ SerpAPI 검색 중 오류 발생: {str(e)}"
+        return f"❌ SerpAPI 검색 중 오류 발생: {str(e)}", False
 
-def search_with_google_cse(query: str) -> str:
-    """Google Custom Search API를 사용한 검색"""
+def search_with_google_cse(query: str) -> Tuple[str, bool]:
+    """Google Custom Search API를 사용한 검색 (검색 결과 또는 안내 메시지, 실제 검색 결과 여부 반환)"""
     try:
         url = "https://www.googleapis.com/customsearch/v1"
         params = {
@@ -84,15 +203,40 @@ def search_with_google_cse(query: str) -> str:
         data = response.json()
         
         if "items" not in data:
-            return f"🔍 '{query}'에 대한 검색 결과를 찾을 수 없습니다."
+            return f"🔍 '{query}'에 대한 검색 결과를 찾을 수 없습니다.", False
         
-        return process_search_results(data["items"], query)
+        return process_search_results(data["items"], query), True
         
     except Exception as e:
-        return f"❌ Google CSE 검색 중 오류 발생: {str(e)}"
+        return f"❌ Google CSE 검색 중 오류 발생: {str(e)}", False
+
+# DuckDuckGo 결과 중 최종적으로 사용할 상위 결과 수 (중복은 점수 계산 전에 제거됨)
+DDG_TOP_K = 3
+
+# DuckDuckGo 동시 검색 스레드 수 (스레드마다 DDGS 세션 하나를 여러 쿼리에 재사용)
+DDG_MAX_WORKERS = 5
+
+class ResultDeduplicator:
+    """여러 검색 스레드가 공유하는 중복 결과 검사기 (URL 또는 정규화된 제목이 같으면 중복)"""
+    
+    def __init__(self):
+        self._seen_urls = set()
+        self._seen_titles = set()
+        self._lock = Lock()
+    
+    def add(self, result: Dict) -> bool:
+        """처음 보는 결과면 등록하고 True, 이미 본 결과면 False"""
+        url = result.get('href', '')
+        title = result.get('title', '').lower().strip()
+        with self._lock:
+            if url in self._seen_urls or title in self._seen_titles:
+                return False
+            self._seen_urls.add(url)
+            self._seen_titles.add(title)
+            return True
 
-def search_with_duckduckgo(query: str) -> str:
-    """DuckDuckGo를 사용한 검색 (완전 개선된 버전)"""
+def search_with_duckduckgo(query: str) -> Tuple[str, bool]:
+    """DuckDuckGo를 사용한 검색 (완전 개선된 버전, 검색 결과 또는 폴백 정보, 실제 검색 결과 여부 반환)"""
     try:
         # 새로운 패키지명 우선 시도
         try:
@@ -121,122 +265,198 @@ def search_with_duckduckgo(query: str) -> str:
             "인공지능 머신러닝 딥러닝 2024년 최신 동향"
         ]
         
-        all_valid_results = []
+        # 점수 상위 TOP_K개만 유지하는 최소 힙 [(점수, -도착 순서, 결과)] (동점이면 먼저 도착한 결과 우선)
+        top_results_heap = []
+        valid_count = 0
         
-        for query_num, search_query in enumerate(high_quality_queries, 1):
-            try:
-                print(f"📡 고품질 검색 {query_num}: {search_query[:60]}...")
-                
-                with DDGS() as ddgs:
-                    search_results = list(ddgs.text(
-                        search_query, 
-                        max_results=8,
-                        safesearch='moderate'
-                    ))
-                
-                if search_results:
-                    # 각 결과를 엄격히 검증
-                    for result in search_results:
-                        if is_high_quality_ai_result(result):
-                            score = calculate_enhanced_ai_score(result)
-                            if score >= 10:  # 높은 임계값 설정
-                                result['ai_score'] = score
-                                all_valid_results.append(result)
-                    
-                    print(f"✅ 검색 {query_num} 완료: {len([r for r in search_results if is_high_quality_ai_result(r)])}개 유효 결과")
-                    
-                    # 충분한 고품질 결과 확보 시 중단
-                    if len(all_valid_results) >= 6:
-                        break
-                else:
-                    print(f"⚠️ 검색 {query_num}: 결과 없음")
-                    
-            except Exception as e:
-                print(f"❌ 검색 {query_num} 실패: {str(e)}")
-                continue
-        
-        if not all_valid_results:
-            print("🔄 유효한 결과가 없어 폴백 실행")
-            return fallback_search(query)
+        # 작업 스레드마다 DDGS 세션을 하나씩 만들어 여러 쿼리에 재사용
+        ddgs_local = threading.local()
         
-        # 점수순 정렬 및 중복 제거
-        all_valid_results.sort(key=lambda x: x['ai_score'], reverse=True)
+        def open_ddgs():
+            ddgs_local.ddgs = DDGS()
         
-        unique_results = []
-        seen_urls = set()
-        seen_titles = set()
+        # 쿼리 간 중복 결과를 점수 계산 전에 제거
+        deduplicator = ResultDeduplicator()
         
-        for result in all_valid_results:
-            url = result.get('href', '')
-            title = result.get('title', '').lower().strip()
-            
-            # URL과 제목 모두 중복 체크
-            if url not in seen_urls and title not in seen_titles:
-                unique_results.append(result)
-                seen_urls.add(url)
-                seen_titles.add(title)
+        # 모든 검색 쿼리를 동시에 실행하고 완료되는 순서대로 결과 수집 (네트워크 대기 병렬화)
+        executor = ThreadPoolExecutor(max_workers=DDG_MAX_WORKERS, initializer=open_ddgs)
+        try:
+            futures = [
+                executor.submit(run_ddg_query, ddgs_local, deduplicator, query_num, search_query)
+                for query_num, search_query in enumerate(high_quality_queries, 1)
+            ]
+            for future in as_completed(futures):
+                for result in future.result():
+                    entry = (result['ai_score'], -valid_count, result)
+                    valid_count += 1
+                    if len(top_results_heap) < DDG_TOP_K:
+                        heapq.heappush(top_results_heap, entry)
+                    else:
+                        heapq.heappushpop(top_results_heap, entry)
                 
-                if len(unique_results) >= 3:
+                # 충분한 고품질 결과 확보 시 나머지 검색은 기다리지 않음
+                if valid_count >= 6:
+                    for pending in futures:
+                        pending.cancel()
                     break
+        finally:
+            executor.shutdown(wait=False)
+        
+        if not top_results_heap:
+            print("🔄 유효한 결과가 없어 폴백 실행")
+            return fallback_search(query), False
+        
+        # 상위 결과를 점수순으로 정렬 (중복은 수집 단계에서 이미 제거됨)
+        unique_results = [
+            result for _, _, result in sorted(top_results_heap, key=lambda entry: entry[:2], reverse=True)
+        ]
         
         print(f"📊 최종 고품질 결과: {len(unique_results)}개")
         if unique_results:
             print(f"📋 최고 점수 결과: {unique_results[0].get('title', 'N/A')} (점수: {unique_results[0].get('ai_score', 0)})")
         
-        return process_search_results(unique_results, query, is_duckduckgo=True)
+        return process_search_results(unique_results, query, is_duckduckgo=True), True
         
     except Exception as e:
         print(f"❌ DuckDuckGo 검색 전체 실패: {str(e)}")
-        return fallback_search(query)
+        return fallback_search(query), False
+
+def run_ddg_query(ddgs_local: threading.local, deduplicator: ResultDeduplicator,
+                  query_num: int, search_query: str) -> List[Dict]:
+    """DuckDuckGo 검색 쿼리 하나를 실행하고 검증/점수 기준을 통과한 결과만 반환 (작업 스레드에서 실행)"""
+    try:
+        print(f"📡 고품질 검색 {query_num}: {search_query[:60]}...")
+        
+        # 현재 작업 스레드의 DDGS 세션 사용
+        search_results = list(ddgs_local.ddgs.text(
+            search_query, 
+            max_results=8,
+            safesearch='moderate'
+        ))
+        
+        if not search_results:
+            print(f"⚠️ 검색 {query_num}: 결과 없음")
+            return []
+        
+        # 각 결과를 엄격히 검증
+        valid_results = []
+        high_quality_count = 0
+        for result in search_results:
+            if is_high_quality_ai_result(result):
+                high_quality_count += 1
+                # 다른 쿼리에서 이미 나온 결과는 점수 계산 없이 건너뜀
+                if not deduplicator.add(result):
+                    continue
+                score = calculate_enhanced_ai_score(result)
+                if score >= 10:  # 높은 임계값 설정
+                    result['ai_score'] = score
+                    valid_results.append(result)
+        
+        print(f"✅ 검색 {query_num} 완료: {high_quality_count}개 유효 결과")
+        return valid_results
+        
+    except Exception as e:
+        print(f"❌ 검색 {query_num} 실패: {str(e)}")
+        return []
+
+def compile_keyword_pattern(keywords) -> "re.Pattern":
+    """키워드 목록을 하나의 정규식으로 컴파일 (텍스트를 키워드별로 반복 검색하지 않고 한 번만 스캔)"""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+def host_suffixes(url: str) -> List[str]:
+    """URL 호스트와 상위 도메인 목록 (예: a.b.com → ['a.b.com', 'b.com'])"""
+    labels = (urlsplit(url).hostname or "").split(".")
+    return [".".join(labels[i:]) for i in range(len(labels) - 1)]
+
+# 결과 품질 검사용 키워드 (모듈 로드 시 한 번만 컴파일)
+# 강력 차단 목록 (즉시 거부): 호스트 단위 차단 + 특정 경로 차단
+BLOCKED_RESULT_HOSTS = frozenset({
+    'zhihu.com', 'weibo.com', 'douban.com', 'baidu.com',
+    'answers.microsoft.com', 'etymonline.com', 'dictionary.com', 'wikipedia.org'
+})
+BLOCKED_RESULT_PATHS = ('microsoft.com/ko-kr/microsoft-365',)
+
+BLOCKED_RESULT_KEYWORDS = (
+    '윈도우', 'windows', '엑셀', 'excel', '오피스', 'office',
+    '로그인', '계정', '활동', '업로드', '다운로드', '설치',
+    '파일', '저장', '잠금', '화면', '뜻', '어원', '사전'
+)
+
+# AI 관련 필수 키워드
+AI_REQUIRED_KEYWORDS = (
+    'ai', 'artificial intelligence', '인공지능', 
+    'machine learning', '머신러닝', 'deep learning', '딥러닝',
+    'neural', '신경망', 'algorithm', '알고리즘',
+    'chatgpt', 'gpt', 'llm', 'generative', '생성형'
+)
+
+# 기술/동향 관련 키워드
+TECH_KEYWORDS = (
+    'technology', '기술', 'trend', '동향', 'development', '발전',
+    'innovation', '혁신', 'research', '연구', '2024', '최신', 'latest'
+)
+
+_BLOCKED_RESULT_KEYWORD_RE = compile_keyword_pattern(BLOCKED_RESULT_KEYWORDS)
+_AI_REQUIRED_RE = compile_keyword_pattern(AI_REQUIRED_KEYWORDS)
+_TECH_RE = compile_keyword_pattern(TECH_KEYWORDS)
 
 def is_high_quality_ai_result(result: Dict) -> bool:
     """고품질 AI 결과인지 엄격히 판단"""
-    title = result.get("title", "").lower()
-    body = result.get("body", "").lower()
     url = result.get("href", "").lower()
     
-    # 강력 차단 목록 (즉시 거부)
-    blocked_domains = [
-        'zhihu.com', 'weibo.com', 'douban.com', 'baidu.com',
-        'answers.microsoft.com', 'microsoft.com/ko-kr/microsoft-365',
-        'etymonline.com', 'dictionary.com', 'wikipedia.org'
-    ]
-    
-    blocked_keywords = [
-        '윈도우', 'windows', '엑셀', 'excel', '오피스', 'office',
-        '로그인', '계정', '활동', '업로드', '다운로드', '설치',
-        '파일', '저장', '잠금', '화면', '뜻', '어원', '사전'
-    ]
-    
-    # 도메인 차단 검사
-    if any(domain in url for domain in blocked_domains):
+    # 도메인 차단 검사 (키워드 검사 전에 호스트 집합 조회로 먼저 거름)
+    if any(host in BLOCKED_RESULT_HOSTS for host in host_suffixes(url)):
+        return False
+    if any(path in url for path in BLOCKED_RESULT_PATHS):
         return False
     
+    title = result.get("title", "").lower()
+    body = result.get("body", "").lower()
+    
     # 키워드 차단 검사
     full_text = f"{title} {body}"
-    if any(keyword in full_text for keyword in blocked_keywords):
+    if _BLOCKED_RESULT_KEYWORD_RE.search(full_text):
         return False
     
-    # AI 관련 필수 키워드 검사
-    ai_required_keywords = [
-        'ai', 'artificial intelligence', '인공지능', 
-        'machine learning', '머신러닝', 'deep learning', '딥러닝',
-        'neural', '신경망', 'algorithm', '알고리즘',
-        'chatgpt', 'gpt', 'llm', 'generative', '생성형'
-    ]
-    
-    # 최소 하나의 AI 키워드는 포함되어야 함
-    has_ai_keyword = any(keyword in full_text for keyword in ai_required_keywords)
-    
-    # 기술/동향 관련 키워드
-    tech_keywords = [
-        'technology', '기술', 'trend', '동향', 'development', '발전',
-        'innovation', '혁신', 'research', '연구', '2024', '최신', 'latest'
-    ]
-    
-    has_tech_keyword = any(keyword in full_text for keyword in tech_keywords)
-    
-    return has_ai_keyword and has_tech_keyword
+    # 최소 하나의 AI 키워드와 기술/동향 키워드가 포함되어야 함
+    return bool(_AI_REQUIRED_RE.search(full_text)) and bool(_TECH_RE.search(full_text))
+
+# AI 관련성 점수 가중치 (모듈 로드 시 한 번만 구성)
+# 고가치 AI 키워드
+PREMIUM_AI_KEYWORDS = {
+    'artificial intelligence': 20, 'ai technology': 18, '인공지능 기술': 20,
+    'machine learning': 15, '머신러닝': 15, 'deep learning': 15, '딥러닝': 15,
+    'neural network': 12, '신경망': 12, 'chatgpt': 15, 'gpt': 12,
+    'generative ai': 18, '생성형 ai': 18, 'llm': 12, '대화형 ai': 12
+}
+
+# 기술 동향 키워드
+TREND_KEYWORDS = {
+    'technology trends': 10, '기술 동향': 10, 'latest developments': 8,
+    '최신 발전': 8, 'innovation': 6, '혁신': 6, '2024': 8, 'recent': 5
+}
+
+# 고품질 도메인 보너스
+QUALITY_DOMAINS = {
+    'techcrunch.com': 15, 'wired.com': 12, 'reuters.com': 15,
+    'bloomberg.com': 12, 'zdnet.co.kr': 10, 'bloter.net': 8,
+    'aitimes.kr': 12, 'medium.com': 8, 'towardsdatascience.com': 10,
+    'arxiv.org': 15, 'nature.com': 18, 'science.org': 15,
+    'openai.com': 20, 'deepmind.com': 18, 'ai.google': 15
+}
+
+_SCORE_WEIGHTS = {**PREMIUM_AI_KEYWORDS, **TREND_KEYWORDS}
+# 전방 탐색으로 모든 위치의 키워드 출현을 한 번의 스캔으로 집계
+# (서로 겹치는 키워드, 예: 'chatgpt'와 'gpt'도 키워드별 str.count와 같은 횟수로 셈)
+_SCORE_RE = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in _SCORE_WEIGHTS) + "))")
+_TITLE_AI_RE = compile_keyword_pattern(('ai', 'artificial intelligence', '인공지능'))
+
+def quality_domain_bonus(url: str) -> int:
+    """URL에 고품질 도메인이 포함되어 있으면 보너스 점수 반환 (기존 점수와 같도록 경로 포함 부분 문자열 기준, 첫 일치만 반영)"""
+    for domain, bonus in QUALITY_DOMAINS.items():
+        if domain in url:
+            return bonus
+    return 0
 
 def calculate_enhanced_ai_score(result: Dict) -> int:
     """향상된 AI 관련성 점수 계산"""
@@ -246,49 +466,14 @@ def calculate_enhanced_ai_score(result: Dict) -> int:
     
     full_text = f"{title} {body} {url}"
     
-    # 고가치 AI 키워드
-    premium_ai_keywords = {
-        'artificial intelligence': 20, 'ai technology': 18, '인공지능 기술': 20,
-        'machine learning': 15, '머신러닝': 15, 'deep learning': 15, '딥러닝': 15,
-        'neural network': 12, '신경망': 12, 'chatgpt': 15, 'gpt': 12,
-        'generative ai': 18, '생성형 ai': 18, 'llm': 12, '대화형 ai': 12
-    }
-    
-    # 기술 동향 키워드
-    trend_keywords = {
-        'technology trends': 10, '기술 동향': 10, 'latest developments': 8,
-        '최신 발전': 8, 'innovation': 6, '혁신': 6, '2024': 8, 'recent': 5
-    }
-    
-    # 고품질 도메인 보너스
-    quality_domains = {
-        'techcrunch.com': 15, 'wired.com': 12, 'reuters.com': 15,
-        'bloomberg.com': 12, 'zdnet.co.kr': 10, 'bloter.net': 8,
-        'aitimes.kr': 12, 'medium.com': 8, 'towardsdatascience.com': 10,
-        'arxiv.org': 15, 'nature.com': 18, 'science.org': 15,
-        'openai.com': 20, 'deepmind.com': 18, 'ai.google': 15
-    }
-    
-    score = 0
-    
-    # 프리미엄 AI 키워드 점수
-    for keyword, weight in premium_ai_keywords.items():
-        count = full_text.count(keyword)
-        score += count * weight
-    
-    # 동향 키워드 점수
-    for keyword, weight in trend_keywords.items():
-        count = full_text.count(keyword)
-        score += count * weight
+    # 프리미엄 AI 키워드 + 동향 키워드 점수 (한 번의 스캔)
+    score = sum(_SCORE_WEIGHTS[match.group(1)] for match in _SCORE_RE.finditer(full_text))
     
     # 도메인 보너스
-    for domain, bonus in quality_domains.items():
-        if domain in url:
-            score += bonus
-            break
+    score += quality_domain_bonus(url)
     
     # 제목에서 AI 키워드 보너스
-    if any(ai_word in title for ai_word in ['ai', 'artificial intelligence', '인공지능']):
+    if _TITLE_AI_RE.search(title):
         score += 10
     
     return score
@@ -305,9 +490,8 @@ def fallback_search(query: str) -> str:
         print(f"❌ 폴백 검색 실패: {str(e)}")
         return comprehensive_ai_trends_info(query)
 
-def comprehensive_ai_trends_info(query: str) -> str:
-    """포괄적인 AI 기술 동향 정보 제공"""
-    return f"""
+# 폴백 AI 기술 동향 정보 (검색어만 바꿔 넣는 고정 템플릿)
+FALLBACK_TEMPLATE = """
 🔍 '{query}' 검색 결과:
 
 📄 2024년 AI 기술 주요 동향:
@@ -346,10 +530,17 @@ AI 안전성, 편향성 제거, 투명성 확보가 기술 개발의 핵심 고
 ──────────────────────────────────────────────────
 """
 
+def comprehensive_ai_trends_info(query: str) -> str:
+    """포괄적인 AI 기술 동향 정보 제공"""
+    return FALLBACK_TEMPLATE.format(query=query)
+
 # ─────────────────────────────────────────────
-# 3) 검색 결과 처리 및 포맷팅
+# 4) 검색 결과 처리 및 포맷팅
 # ─────────────────────────────────────────────
 
+# 이 길이 이상의 요약은 페이지 내용 대신 사용 (출력에서 내용은 300자로 잘리므로 스크래핑 생략)
+SNIPPET_SUFFICIENT_LENGTH = 250
+
 def process_search_results(results: List[Dict], query: str, is_duckduckgo: bool = False) -> str:
     """검색 결과 처리 및 포맷팅"""
     if not results:
@@ -357,27 +548,41 @@ def process_search_results(results: List[Dict], query: str, is_duckduckgo: bool
     
     print(f"📝 검색 결과 처리 시작: {len(results)}개")
     
-    formatted_output = [f"🔍 '{query}' 검색 결과:\n"]
-    
+    # 결과별 기본 정보 추출
+    entries = []
     for i, result in enumerate(results[:3], 1):
+        if is_duckduckgo:
+            title = result.get("title", "제목 없음")
+            snippet = result.get("body", "요약 없음")
+            link = result.get("href", "")
+            ai_score = result.get("ai_score", 0)
+        else:
+            title = result.get("title", "제목 없음")
+            snippet = result.get("snippet", "요약 없음")
+            link = result.get("link", "")
+            ai_score = 0
+        
+        print(f"🔗 {i}번째 결과 처리: {title[:50]}... (AI점수: {ai_score})")
+        print(f"   링크: {link}")
+        entries.append((title, snippet, link))
+    
+    # 요약이 충분히 긴 결과는 요약을 내용으로 사용하고, 나머지만 동시 스크래핑
+    # (스크래핑 전용 이벤트 루프에서 gather, 결과 순서 유지, 실패해도 계속 진행)
+    page_contents = [snippet if snippet and len(snippet) >= SNIPPET_SUFFICIENT_LENGTH else None for _, snippet, _ in entries]
+    to_scrape = [i for i, content in enumerate(page_contents) if content is None]
+    if len(to_scrape) < len(entries):
+        print(f"⏭️ 요약으로 충분한 결과 {len(entries) - len(to_scrape)}개는 스크래핑 생략")
+    if to_scrape:
+        scraped = run_on_scrape_loop(scrape_webpages_async([entries[i][2] for i in to_scrape]))
+        for i, content in zip(to_scrape, scraped):
+            page_contents[i] = content
+    
+    # 헤더(0번) + 결과 수만큼 미리 할당 후 인덱스로 채움
+    formatted_output = [None] * (len(entries) + 1)
+    formatted_output[0] = f"🔍 '{query}' 검색 결과:\n"
+    
+    for i, ((title, snippet, link), page_content) in enumerate(zip(entries, page_contents), 1):
         try:
-            if is_duckduckgo:
-                title = result.get("title", "제목 없음")
-                snippet = result.get("body", "요약 없음")
-                link = result.get("href", "")
-                ai_score = result.get("ai_score", 0)
-            else:
-                title = result.get("title", "제목 없음")
-                snippet = result.get("snippet", "요약 없음")
-                link = result.get("link", "")
-                ai_score = 0
-            
-            print(f"🔗 {i}번째 결과 처리: {title[:50]}... (AI점수: {ai_score})")
-            print(f"   링크: {link}")
-            
-            # 웹페이지 내용 스크래핑 (실패해도 계속 진행)
-            page_content = scrape_webpage(link)
-            
             formatted_result = f"""
 📄 결과 {i}:
 제목: {title}
@@ -386,139 +591,207 @@ def process_search_results(results: List[Dict], query: str, is_duckduckgo: bool
 내용: {page_content[:300]}...
 {'─' * 50}
 """
-            formatted_output.append(formatted_result)
-            
         except Exception as e:
             print(f"❌ {i}번째 결과 처리 중 오류: {str(e)}")
             # 오류가 발생해도 기본 정보는 제공
             formatted_result = f"""
 📄 결과 {i}:
-제목: {title if 'title' in locals() else "제목 없음"}
-요약: {snippet[:200] if 'snippet' in locals() else "요약 없음"}...
-링크: {link if 'link' in locals() else "링크 없음"}
+제목: {title or "제목 없음"}
+요약: {(snippet or "요약 없음")[:200]}...
+링크: {link or "링크 없음"}
 내용: 스크래핑 실패
 {'─' * 50}
 """
-            formatted_output.append(formatted_result)
+        formatted_output[i] = formatted_result
     
     final_result = "\n".join(formatted_output)
     print(f"✅ 검색 결과 처리 완료: {len(final_result)} 문자")
     return final_result
 
-def scrape_webpage(url: str) -> str:
-    """개선된 웹페이지 내용 스크래핑"""
+# 스크래핑 전용 백그라운드 이벤트 루프 (프로세스 전체에서 공유, 최초 사용 시 데몬 스레드에서 시작)
+_scrape_loop: Optional[asyncio.AbstractEventLoop] = None
+_scrape_loop_lock = Lock()
+
+def get_scrape_loop() -> asyncio.AbstractEventLoop:
+    """스크래핑 전용 이벤트 루프 조회 (없으면 생성 후 데몬 스레드에서 실행)"""
+    global _scrape_loop
+    with _scrape_loop_lock:
+        if _scrape_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="scrape-loop", daemon=True).start()
+            _scrape_loop = loop
+    return _scrape_loop
+
+def run_on_scrape_loop(coro):
+    """동기 코드에서 코루틴을 스크래핑 전용 이벤트 루프로 실행하고 결과 대기 (호출 스레드의 이벤트 루프와 무관)"""
+    return asyncio.run_coroutine_threadsafe(coro, get_scrape_loop()).result()
+
+# HTML 파서 (C 기반 lxml 우선, 미설치 시 내장 파서 사용)
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# 스크래핑 차단 사이트
+_BLOCKED_SCRAPE_DOMAIN_RE = compile_keyword_pattern(
+    ('zhihu.com', 'weibo.com', 'douban.com', 'answers.microsoft.com', 'etymonline.com')
+)
+
+def check_scrape_url(url: str) -> Optional[str]:
+    """스크래핑할 수 없는 URL이면 사유 메시지 반환"""
     if not url:
         return "URL이 제공되지 않았습니다."
     
+    # 문제 있는 사이트 미리 차단
+    if _BLOCKED_SCRAPE_DOMAIN_RE.search(url):
+        return "해당 사이트는 접근이 제한되어 있습니다."
+    
+    return None
+
+# 본문 추출에 사용할 최대 응답 크기 (이후 내용은 내려받지 않음)
+MAX_PAGE_BYTES = 200_000
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+NOT_HTML_MESSAGE = "HTML 문서가 아니어서 내용을 추출하지 않았습니다."
+
+def is_html_content(content_type: str) -> bool:
+    """Content-Type 헤더가 HTML 문서인지 확인 (헤더가 없으면 HTML로 간주)"""
+    return not content_type or content_type.split(";")[0].strip().lower() in HTML_CONTENT_TYPES
+
+def http_status_message(status_code: int) -> str:
+    """HTTP 오류 상태 코드 안내 메시지"""
+    if status_code == 403:
+        return "접근이 금지된 사이트입니다."
+    elif status_code == 404:
+        return "페이지를 찾을 수 없습니다."
+    else:
+        return f"HTTP 오류: {status_code}"
+
+# 본문 텍스트 조각 구분자: 줄바꿈 문자(str.splitlines 기준) 또는 두 칸 이상의 공백
+_TEXT_CHUNK_SPLIT_RE = re.compile(r"[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]| {2,}")
+
+def parse_webpage(content: bytes) -> str:
+    """HTML에서 본문 텍스트 추출 및 정제"""
+    soup = BeautifulSoup(content, HTML_PARSER)
+    
+    # 불필요한 요소 제거
+    for element in soup(["script", "style", "nav", "footer", "header", "aside", "iframe", "noscript"]):
+        element.decompose()
+    
+    # 메인 콘텐츠 추출 우선순위
+    main_content = None
+    for selector in ['main', 'article', '.content', '#content', '.post', '.entry']:
+        main_content = soup.select_one(selector)
+        if main_content:
+            break
+    
+    if not main_content:
+        main_content = soup
+    
+    text = main_content.get_text()
+    
+    # 텍스트 정제 (줄바꿈/연속 공백 기준으로 한 번에 분리하고 2글자 이하 조각은 제외)
+    chunks = (chunk.strip() for chunk in _TEXT_CHUNK_SPLIT_RE.split(text))
+    clean_text = ' '.join(chunk for chunk in chunks if len(chunk) > 2)
+    
+    # 길이 제한
+    if len(clean_text) > 1000:
+        clean_text = clean_text[:1000] + "..."
+    
+    return clean_text if clean_text else "텍스트 내용을 추출할 수 없습니다."
+
+# 스크래핑 전용 이벤트 루프에 묶인 공유 HTTP 클라이언트와 동시 요청 제한 (해당 루프에서 최초 사용 시 생성)
+_scrape_client: Optional[httpx.AsyncClient] = None
+_scrape_semaphore: Optional[asyncio.Semaphore] = None
+
+def get_scrape_client() -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    """공유 HTTP 클라이언트(연결 풀로 TCP/TLS 연결 재사용)와 프로세스 전체 동시 요청 세마포어 조회"""
+    global _scrape_client, _scrape_semaphore
+    if _scrape_client is None:
+        _scrape_client = httpx.AsyncClient(
+            headers=SCRAPE_HEADERS,
+            timeout=8,
+            follow_redirects=True,
+            # 연결 풀 한도는 transport에 지정 (transport를 넘기면 클라이언트의 limits 인자는 무시됨)
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            )
+        )
+        _scrape_semaphore = asyncio.Semaphore(SCRAPE_MAX_CONCURRENCY)
+    return _scrape_client, _scrape_semaphore
+
+async def scrape_webpages_async(urls: List[str]) -> List[str]:
+    """여러 웹페이지를 공유 비동기 클라이언트로 동시에 스크래핑 (스크래핑 전용 이벤트 루프에서 실행, 입력 순서대로 반환)"""
+    client, semaphore = get_scrape_client()
+    return list(await asyncio.gather(*(scrape_webpage_async(client, url, semaphore) for url in urls)))
+
+async def scrape_webpage_async(client: httpx.AsyncClient, url: str, semaphore: asyncio.Semaphore) -> str:
+    """웹페이지 내용 비동기 스크래핑 (URL별 결과 캐시, 실패 결과는 짧게 캐시하여 같은 URL 재요청 방지)"""
+    cached = SCRAPE_CACHE.get(url)
+    if cached is not None:
+        print(f"💾 스크래핑 캐시 사용: {url}")
+        return cached
+    
+    result, success = await fetch_webpage_async(client, url, semaphore)
+    SCRAPE_CACHE.set(url, result, ttl=None if success else SCRAPE_ERROR_TTL)
+    return result
+
+async def fetch_webpage_async(client: httpx.AsyncClient, url: str, semaphore: asyncio.Semaphore) -> Tuple[str, bool]:
+    """웹페이지 내용 비동기 스크래핑 (추출 텍스트 또는 오류 메시지, 성공 여부 반환)"""
+    error_message = check_scrape_url(url)
+    if error_message:
+        return error_message, False
+    
     try:
+        # 호스트별 속도 제한 대기 후 동시 요청 수 제한 안에서 요청
+        await SCRAPE_HOST_LIMITER.acquire(urlsplit(url).hostname or "")
         print(f"🌐 웹페이지 스크래핑 시작: {url}")
         
-        # 문제 있는 사이트 미리 차단
-        blocked_domains = ['zhihu.com', 'weibo.com', 'douban.com', 'answers.microsoft.com', 'etymonline.com']
-        if any(domain in url for domain in blocked_domains):
-            return "해당 사이트는 접근이 제한되어 있습니다."
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-        
-        # 재시도 로직 추가
-        max_retries = 2
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, headers=headers, timeout=8, allow_redirects=True)
+        # 본문은 스트리밍으로 MAX_PAGE_BYTES까지만 내려받음
+        try:
+            async with semaphore, client.stream("GET", url) as response:
                 response.raise_for_status()
-                break
-            except requests.exceptions.Timeout:
-                if attempt == max_retries - 1:
-                    return "페이지 로딩 시간 초과"
-                time.sleep(1)
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 403:
-                    return "접근이 금지된 사이트입니다."
-                elif e.response.status_code == 404:
-                    return "페이지를 찾을 수 없습니다."
-                else:
-                    return f"HTTP 오류: {e.response.status_code}"
-        
-        # 인코딩 자동 감지
-        if response.encoding == 'ISO-8859-1':
-            response.encoding = response.apparent_encoding
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # 불필요한 요소 제거
-        for element in soup(["script", "style", "nav", "footer", "header", "aside", "iframe", "noscript"]):
-            element.decompose()
-        
-        # 메인 콘텐츠 추출 우선순위
-        main_content = None
-        for selector in ['main', 'article', '.content', '#content', '.post', '.entry']:
-            main_content = soup.select_one(selector)
-            if main_content:
-                break
-        
-        if not main_content:
-            main_content = soup
-        
-        text = main_content.get_text()
-        
-        # 텍스트 정제
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        clean_text = ' '.join(chunk for chunk in chunks if chunk and len(chunk) > 2)
-        
-        # 길이 제한
-        if len(clean_text) > 1000:
-            clean_text = clean_text[:1000] + "..."
-        
-        result = clean_text if clean_text else "텍스트 내용을 추출할 수 없습니다."
+                if not is_html_content(response.headers.get("Content-Type", "")):
+                    return NOT_HTML_MESSAGE, False
+                
+                content = bytearray()
+                async for chunk in response.aiter_bytes(chunk_size=8192):
+                    content.extend(chunk)
+                    if len(content) >= MAX_PAGE_BYTES:
+                        break
+        except httpx.TimeoutException:
+            return "페이지 로딩 시간 초과", False
+        except httpx.HTTPStatusError as e:
+            return http_status_message(e.response.status_code), False
+        
+        result = parse_webpage(bytes(content))
         print(f"✅ 스크래핑 완료: {len(result)} 문자")
-        return result
+        return result, True
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"🌐 네트워크 오류: {str(e)}")
-        return f"네트워크 오류: {str(e)}"
+        return f"네트워크 오류: {str(e)}", False
     except Exception as e:
         print(f"❌ 스크래핑 실패: {str(e)}")
-        return f"스크래핑 실패: {str(e)}"
+        return f"스크래핑 실패: {str(e)}", False
 
 # ─────────────────────────────────────────────
-# 4) 검색 쿼리 생성 도구
+# 5) 검색 쿼리 생성 도구
 # ─────────────────────────────────────────────
 
-@tool
-def query_generator_tool(user_request: str, domain: str) -> str:
+@functools.lru_cache(maxsize=None)
+def get_query_llm(temperature: float) -> ChatOpenAI:
     """
-    AI 특화 검색 쿼리 생성 도구
+    쿼리 생성용 ChatOpenAI 클라이언트 (temperature별로 한 번만 생성하여 재사용)
+    
+    agent_setup이 .env를 로드하기 전에 이 모듈을 임포트하므로 임포트 시점이 아닌 첫 사용 시 생성
     """
-    try:
-        # AI 관련 요청인지 확인
-        ai_request_indicators = ['ai', 'artificial intelligence', '인공지능', 'machine learning', 
-                               '머신러닝', 'deep learning', '딥러닝', '기술 동향', 'technology trend']
-        
-        is_ai_request = any(indicator in user_request.lower() for indicator in ai_request_indicators)
-        
-        if is_ai_request:
-            # AI 관련 요청에 특화된 쿼리 생성
-            ai_queries = [
-                f"artificial intelligence trends 2024 {domain}",
-                f"AI technology developments 2024 latest",
-                f"인공지능 기술 동향 2024 최신",
-                f"machine learning innovations 2024"
-            ]
-            return " OR ".join(ai_queries[:2])  # 상위 2개 조합
-        else:
-            # 일반적인 쿼리 생성
-            llm = ChatOpenAI(model="gpt-4o", temperature=0)
-            
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", """효과적인 검색 쿼리를 생성하세요.
+    return ChatOpenAI(model="gpt-4o", temperature=temperature)
+
+# 검색 쿼리 생성 프롬프트 (모듈 로드 시 한 번만 구성)
+QUERY_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """효과적인 검색 쿼리를 생성하세요.
                 
                 원칙:
                 1. 핵심 키워드 포함
@@ -526,34 +799,58 @@ def query_generator_tool(user_request: str, domain: str) -> str:
                 3. 간결하고 명확한 쿼리
                 
                 결과는 검색 쿼리만 반환하세요."""),
-                ("human", "사용자 요청: {user_request}\n도메인: {domain}\n검색 쿼리:")
-            ])
-            
-            chain = prompt | llm
-            response = chain.invoke({"user_request": user_request, "domain": domain})
-            
-            return response.content.strip()
+    ("human", "사용자 요청: {user_request}\n도메인: {domain}\n검색 쿼리:")
+])
+
+@functools.lru_cache(maxsize=None)
+def get_query_chain():
+    """검색 쿼리 생성 체인 (프롬프트 | LLM, 첫 사용 시 한 번만 구성)"""
+    return QUERY_PROMPT | get_query_llm(temperature=0)
+
+@tool
+def query_generator_tool(user_request: str, domain: str) -> str:
+    """
+    AI 특화 검색 쿼리 생성 도구
+    """
+    try:
+        return generate_search_query(user_request, domain)
         
     except Exception as e:
         print(f"❌ 쿼리 생성 중 오류: {str(e)}")
         # 에러 발생 시 AI 특화 기본 쿼리 반환
         return f"AI technology {user_request} 2024 latest trends"
 
+@functools.lru_cache(maxsize=256)
+def generate_search_query(user_request: str, domain: str) -> str:
+    """검색 쿼리 생성 (같은 요청/도메인은 캐시된 결과 재사용, 오류는 캐시하지 않음)"""
+    # AI 관련 요청인지 확인
+    ai_request_indicators = ['ai', 'artificial intelligence', '인공지능', 'machine learning', 
+                           '머신러닝', 'deep learning', '딥러닝', '기술 동향', 'technology trend']
+    
+    is_ai_request = any(indicator in user_request.lower() for indicator in ai_request_indicators)
+    
+    if is_ai_request:
+        # AI 관련 요청에 특화된 쿼리 생성
+        ai_queries = [
+            f"artificial intelligence trends 2024 {domain}",
+            f"AI technology developments 2024 latest",
+            f"인공지능 기술 동향 2024 최신",
+            f"machine learning innovations 2024"
+        ]
+        return " OR ".join(ai_queries[:2])  # 상위 2개 조합
+    else:
+        # 일반적인 쿼리 생성
+        response = get_query_chain().invoke({"user_request": user_request, "domain": domain})
+        
+        return response.content.strip()
+
 # ─────────────────────────────────────────────
-# 5) 다중 검색 쿼리 생성 도구
+# 6) 다중 검색 쿼리 생성 도구
 # ─────────────────────────────────────────────
 
-@tool
-def multiple_query_generator_tool(user_request: str, domain: str) -> str:
-    """
-    포괄적인 조사를 위해 여러 검색 쿼리를 생성합니다.
-    다양한 관점에서 검색할 때 사용하세요.
-    """
-    try:
-        llm = ChatOpenAI(model="gpt-4o", temperature=0.3)
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """포괄적인 검색을 위해 3개의 서로 다른 검색 쿼리를 생성하세요.
+# 다중 검색 쿼리 생성 프롬프트 (모듈 로드 시 한 번만 구성)
+MULTIPLE_QUERY_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """포괄적인 검색을 위해 3개의 서로 다른 검색 쿼리를 생성하세요.
             
             각 쿼리는 다음 관점에서:
             1. 기본 개념 및 정의
@@ -561,15 +858,31 @@ def multiple_query_generator_tool(user_request: str, domain: str) -> str:
             3. 전문가 의견 및 분석
             
             각 쿼리는 한 줄씩 반환하세요."""),
-            ("human", "요청: {user_request}\n도메인: {domain}\n3개 쿼리:")
-        ])
-        
-        chain = prompt | llm
-        response = chain.invoke({"user_request": user_request, "domain": domain})
-        
-        return response.content.strip()
+    ("human", "요청: {user_request}\n도메인: {domain}\n3개 쿼리:")
+])
+
+@functools.lru_cache(maxsize=None)
+def get_multiple_query_chain():
+    """다중 검색 쿼리 생성 체인 (프롬프트 | LLM, 첫 사용 시 한 번만 구성)"""
+    return MULTIPLE_QUERY_PROMPT | get_query_llm(temperature=0.3)
+
+@tool
+def multiple_query_generator_tool(user_request: str, domain: str) -> str:
+    """
+    포괄적인 조사를 위해 여러 검색 쿼리를 생성합니다.
+    다양한 관점에서 검색할 때 사용하세요.
+    """
+    try:
+        return generate_multiple_queries(user_request, domain)
         
     except Exception as e:
         print(f"❌ 다중 쿼리 생성 중 오류: {str(e)}")
         # 에러 발생 시 기본 쿼리들 반환
-        return f"{user_request} {domain} 정의\n{user_request} {domain} 2024 트렌드\n{user_request} {domain} 전문가 분석"
\ No newline at end of file
+        return f"{user_request} {domain} 정의\n{user_request} {domain} 2024 트렌드\n{user_request} {domain} 전문가 분석"
+
+@functools.lru_cache(maxsize=256)
+def generate_multiple_queries(user_request: str, domain: str) -> str:
+    """관점별 검색 쿼리 3개 생성 (같은 요청/도메인은 캐시된 결과 재사용, 오류는 캐시하지 않음)"""
+    response = get_multiple_query_chain().invoke({"user_request": user_request, "domain": domain})
+    
+    return response.content.strip()